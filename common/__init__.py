@@ -40,7 +40,8 @@ from .utilities import (auto_dupl_on, bold, CachedValues, clean_text,
                         wrap_html)
 from .extfiles import (FilesSupplier, MeshElemType, MeshGroupType,
                        external_file, external_files, external_files_callback,
-                       get_cmd_groups, get_cmd_mesh, get_medfile_groups,
+                       file_mtime, get_cmd_groups, get_cmd_mesh,
+                       get_medfile_groups,
                        get_medfile_groups_by_type, get_medfile_meshes,
                        is_medfile, is_reference)
 from .exceptions import (AsterStudyError, AsterStudyInterrupt, CatalogError,
@@ -37,7 +37,7 @@ __all__ = ["MeshGroupType", "MeshElemType", "FilesSupplier", "is_reference",
            "external_file_groups_by_type", "external_file_export_to_med",
            "external_files_callback", "get_medfile_meshes",
            "get_medfile_groups", "get_medfile_groups_by_type",
-           "get_cmd_groups"]
+           "get_cmd_groups", "file_mtime"]
 
 
 class MeshGroupType(object):
@@ -658,16 +658,23 @@ def get_cmd_mesh(command):
 USE_CACHE = True
 
 class CachedMeshData(object):
-    """Cache object for MED file data."""
+    """
+    Cache object for MED file data.
+
+    Data of MED file is dropped as soon as file's modification time
+    differs from the one it had when data was cached.
+    """
 
     def __init__(self):
         """Initialize cache."""
         self._cache = {}
+        self._mtimes = {}
 
     def get_meshes(self, mesh_file):
         """Get cached names of meshes for given MED file."""
         if not USE_CACHE:
             return []
+        self._check_file(mesh_file)
         return self._cache.get(mesh_file, {}).keys()
 
     def add_mesh(self, mesh_file, mesh_name):
@@ -675,7 +682,7 @@ class CachedMeshData(object):
         if not USE_CACHE:
             return
         if mesh_file not in self._cache:
-            self._cache[mesh_file] = OrderedDict()
+            self._add_file(mesh_file)
         if mesh_name not in self._cache[mesh_file]:
             self._cache[mesh_file][mesh_name] = OrderedDict()
 
@@ -690,6 +697,7 @@ class CachedMeshData(object):
         """Check if there is stored groups data for given mesh."""
         if not USE_CACHE:
             return False
+        self._check_file(mesh_file)
         return mesh_file in self._cache and \
             mesh_name in self._cache[mesh_file] and \
             elem_type in self._cache[mesh_file][mesh_name]
@@ -710,7 +718,7 @@ class CachedMeshData(object):
         if not USE_CACHE:
             return
         if mesh_file not in self._cache:
-            self._cache[mesh_file] = OrderedDict()
+            self._add_file(mesh_file)
         if mesh_name not in self._cache[mesh_file]:
             self._cache[mesh_file][mesh_name] = OrderedDict()
         if elem_type not in self._cache[mesh_file][mesh_name]:
@@ -736,9 +744,11 @@ class CachedMeshData(object):
         """Clear cache."""
         if mesh_file is None:
             self._cache.clear()
+            self._mtimes.clear()
         elif mesh_name is None:
             if mesh_file in self._cache:
                 del self._cache[mesh_file]
+                del self._mtimes[mesh_file]
         elif elem_type is None:
             if mesh_file in self._cache and \
                     mesh_name in self._cache[mesh_file]:
@@ -749,5 +759,30 @@ class CachedMeshData(object):
                     elem_type in self._cache[mesh_file][mesh_name]:
                 del self._cache[mesh_file][mesh_name][elem_type]
 
+    def _add_file(self, mesh_file):
+        """Create cache entry for MED file."""
+        self._cache[mesh_file] = OrderedDict()
+        self._mtimes[mesh_file] = file_mtime(mesh_file)
+
+    def _check_file(self, mesh_file):
+        """Drop cached data of MED file if it was modified."""
+        if mesh_file in self._cache and \
+                self._mtimes.get(mesh_file) != file_mtime(mesh_file):
+            self.clear_cache(mesh_file)
+
+
+def file_mtime(file_name):
+    """
+    Get modification time of the file.
+
+    Returns:
+        float: Modification time; *None* if it cannot be obtained.
+    """
+    try:
+        return os.path.getmtime(file_name)
+    except (OSError, TypeError):
+        return None
+
+
 # MED file data cache object (singleton)
 MESH_CACHE = CachedMeshData()
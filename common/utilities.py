@@ -860,7 +860,10 @@ def disconnect(signal, slot=None):
     """
     if signal is not None:
         try:
-            signal.disconnect(slot)
+            if slot is None:
+                signal.disconnect()
+            else:
+                signal.disconnect(slot)
         except TypeError: # prevent exception when there's no connection
             pass
 
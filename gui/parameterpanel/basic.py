@@ -65,6 +65,8 @@ class Options(object):
 
     use_translations = True
 
+    translations = {}
+
     @staticmethod
     def translate_command(command, keyword=None, item=None):
         """
@@ -72,6 +74,8 @@ class Options(object):
         'use business oriented translations' option explicitly
         set in *Parameters* panel.
 
+        Translations are cached until `clear_translations()` is called.
+
         Note:
             All items of *Parameters* panel should use this
             method instead of function implemented at package level.
@@ -79,8 +83,23 @@ class Options(object):
         See also:
             `gui.translate_command()`
         """
-        return translate_command(command, keyword, item,
-                                 force_translations=Options.use_translations)
+        use_bo = Options.use_translations
+        key = (command, keyword, item, use_bo)
+        text = Options.translations.get(key)
+        if text is None:
+            text = translate_command(command, keyword, item,
+                                     force_translations=use_bo)
+            Options.translations[key] = text
+        return text
+
+    @staticmethod
+    def clear_translations():
+        """
+        Clear cached translations.
+
+        Must be called when translations options are changed.
+        """
+        Options.translations.clear()
 
 
 class CataInfo(object):
@@ -329,8 +348,8 @@ class ContentData(object):
         contdict = {}
         islist = isinstance(value, (list, tuple))
         if islist:
-            for i in xrange(len(value)):
-                contdict[i+1] = value[i]
+            for i, item in enumerate(value, 1):
+                contdict[i] = item
         elif isinstance(value, dict):
             contdict = value
         else:
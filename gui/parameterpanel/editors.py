@@ -29,24 +29,24 @@ TODO:
 from __future__ import unicode_literals
 
 import os
+import re
+from bisect import bisect_left
 
 from PyQt5.Qt import (Qt, QCheckBox, QComboBox, QDoubleValidator, QHBoxLayout,
                       QIntValidator, QLineEdit, QPushButton, QRegExp, QWidget,
                       QMessageBox, QStyle, QLabel, QFrame, QToolButton, QMenu,
                       QSizePolicy, QStackedWidget, QRegExpValidator, QToolBar,
                       QSize, QEvent, QValidator, QFocusEvent, QApplication,
-                      pyqtSignal, pyqtSlot)
+                      QTimer, QObject, pyqtSignal, pyqtSlot)
 
-from common import (CFG, common_filters, get_cmd_mesh, get_file_name,
-                    get_medfile_meshes, italic, image, is_medfile,
-                    is_subclass, is_reference, load_icon,
+from common import (CFG, common_filters, connect, disconnect, file_mtime,
+                    get_cmd_mesh, get_file_name, get_medfile_meshes, italic,
+                    image, is_medfile, is_subclass, is_reference, load_icon,
                     to_type, translate, wrap_html)
 from datamodel import CATA, IDS, get_cata_typeid
 from datamodel.command import Command, Variable, CO
-from datamodel.command.helper import avail_meshes_in_cmd
 from gui import Role, Panel
 from gui.behavior import behavior
-from gui.variablepanel import VariablePanel
 
 from .basic import EditorLink, KeywordType, Options, parameterPanel
 from .path import ParameterPath
@@ -60,12 +60,22 @@ from .widgets import ParameterButton
 class ParameterEditorFactory(object):
     """Class for editor creators."""
 
+    pool_size = 8
+    """Maximal number of released editors kept for each keyword."""
+
+    pool_limit = 64
+    """Maximal number of released editors kept in the pool."""
+
     def __init__(self):
         """
         Constructor for empty editor factory.
         """
         super(ParameterEditorFactory, self).__init__()
         self._creators = []
+        self._suitable = {}
+        self._pool = {}
+        self._pooled = 0
+        self._holder = None
 
     def registerCreator(self, creator):
         """
@@ -76,6 +86,7 @@ class ParameterEditorFactory(object):
         """
         if creator is not None and creator not in self._creators:
             self._creators.append(creator)
+            self._suitable = {}
 
     def unregisterCreator(self, creator):
         """
@@ -86,39 +97,146 @@ class ParameterEditorFactory(object):
         """
         if creator is not None:
             self._creators.remove(creator)
+            self._suitable = {}
 
     def createEditor(self, path, parent):
         """
         Create editor.
 
+        Only the first suitable editor is built immediately; alternative
+        ones are created by the editor stack when they are requested.
+
         Arguments:
             path: Parameter keyword catalog path.
             parent (QWidget): parent widget
 
         Returns:
-            [QWidget]: list of available editors.
+            QWidget: editor (or editor stack) for the parameter.
         """
-        editors = []
-        for creator in self._creators:
-            editor = creator.createEditor(path, parent)
-            if editor is not None:
-                editors.append(editor)
-                if editor.icon() is None:
-                    break
+        creators = self._suitableCreators(path)
 
         editor = None
-        if len(editors) > 1:
-            editor = ParameterEditorStack(editors, parent)
-        elif len(editors) > 0:
-            editor = editors[0]
+        if len(creators) > 1:
+            editor = ParameterEditorStack(creators, path, parent)
+        elif len(creators) > 0:
+            editor = self._reuseEditor(creators[0], path, parent)
+            if editor is None:
+                editor = creators[0].createEditor(path, parent)
 
         return editor
 
+    def releaseEditor(self, editor):
+        """
+        Release editor which is not used anymore.
+
+        Reusable editors are kept in the pool (hidden) to be given back
+        by `createEditor()` for the same keyword; other editors are
+        destroyed.
+
+        Arguments:
+            editor (ParameterEditor): Editor being released.
+        """
+        if editor is None:
+            return
+        editor.flush(False)
+        editors = None
+        if editor.reusable:
+            editors = self._pool.setdefault(editor.poolKey(), [])
+        if editors is not None and len(editors) < self.pool_size \
+                and self._pooled < self.pool_limit:
+            if self._holder is None:
+                self._holder = QWidget()
+                self._holder.hide()
+            editor.release(self._holder)
+            editors.append(editor)
+            self._pooled += 1
+        else:
+            editor.deleteLater()
+
+    def _suitableCreators(self, path):
+        """
+        Get creators suitable for given parameter.
+
+        Creators only look at the catalog keyword, the keyword type,
+        the position in a sequence and the external list mode, so the
+        result is cached for these properties.
+
+        Arguments:
+            path: Parameter keyword catalog path.
+
+        Returns:
+            list[ParameterEditorFactoryCreator]: Suitable creators.
+        """
+        keyword = path.keyword()
+        key = (id(keyword), path.keywordType(), path.isInSequence(),
+               behavior().external_list)
+        entry = self._suitable.get(key)
+        # keyword is kept in the cache to ensure its id is not reused
+        if entry is None or entry[0] is not keyword:
+            creators = []
+            for creator in self._creators:
+                if creator.isSuitable(path):
+                    creators.append(creator)
+                    if creator.icon() is None:
+                        break
+            entry = (keyword, creators)
+            self._suitable[key] = entry
+        return entry[1]
+
+    def _reuseEditor(self, creator, path, parent):
+        """
+        Get editor from the pool of released editors.
+
+        Arguments:
+            creator (ParameterEditorFactoryCreator): Editor creator.
+            path: Parameter keyword catalog path.
+            parent (QWidget): parent widget
+
+        Returns:
+            QWidget: editor taken from the pool; *None* if there is no
+            suitable one.
+        """
+        editor = None
+        editors = self._pool.get(creator.poolKey(path))
+        if editors:
+            editor = editors.pop()
+            self._pooled -= 1
+            editor.reuse(path, parent)
+        return editor
+
 
 class ParameterEditorFactoryCreator(object):
     """Class for editor creation."""
 
     # pragma pylint: disable=no-self-use,unused-argument
+    def isSuitable(self, path):
+        """
+        Check if the creator provides an editor for given parameter.
+
+        This method must be implemented in sub-classes.
+        Default implementation returns False.
+
+        Arguments:
+            path: Parameter keyword catalog path.
+
+        Returns:
+            bool: *True* if editor can be created; *False* otherwise.
+        """
+        return False
+
+    # pragma pylint: disable=no-self-use
+    def editorClass(self):
+        """
+        Get class of editors built by the creator.
+
+        This method must be implemented in sub-classes.
+        Default implementation returns None.
+
+        Returns:
+            type: Editor class.
+        """
+        return None
+
     def createEditor(self, path, parent):
         """
         Create editor.
@@ -130,7 +248,60 @@ class ParameterEditorFactoryCreator(object):
         Returns:
             QWidget: Editor.
         """
-        return None
+        editor = None
+        cls = self.editorClass()
+        if cls is not None and self.isSuitable(path):
+            editor = cls(path, parent)
+        return editor
+
+    def poolKey(self, path):
+        """
+        Get key of released editors which can be reused for given
+        parameter.
+
+        Must match `ParameterEditor.poolKey()` of the editors built by
+        the creator.
+
+        Arguments:
+            path: Parameter keyword catalog path.
+
+        Returns:
+            tuple: Key in the pool of released editors.
+        """
+        return (self.editorClass(), id(path.keyword()))
+
+    def icon(self):
+        """
+        Get icon associated with the editors built by the creator.
+
+        Returns:
+            str: icon file name.
+        """
+        cls = self.editorClass()
+        return cls.icon() if cls is not None else None
+
+    def description(self):
+        """
+        Get description associated with the editors built by the creator.
+
+        Returns:
+            str: description string.
+        """
+        cls = self.editorClass()
+        return cls.description() if cls is not None else ''
+
+    def accepts(self, value):
+        """
+        Check if the editors built by the creator can show given value.
+
+        Arguments:
+            value (any): Parameter's value.
+
+        Returns:
+            bool: *True* if value is supported; *False* otherwise.
+        """
+        cls = self.editorClass()
+        return cls.accepts(value) if cls is not None else False
 
 
 def parameter_editor_factory():
@@ -182,6 +353,117 @@ def parameter_editor_factory():
     return parameter_editor_factory.factory
 
 
+def shared_validator(typ):
+    """
+    Get the validator shared by the line editors of given type having
+    no bounds.
+
+    Validators are created on first request.
+
+    Arguments:
+        typ (int): Editor type (see `ParameterEditor.EditType`).
+
+    Returns:
+        QValidator: Validator (*None* if type needs no validation).
+    """
+    if not hasattr(shared_validator, "validators"):
+        shared_validator.validators = {
+            ParameterEditor.EditType.Int: QIntValidator(),
+            ParameterEditor.EditType.Real: QDoubleValidator(),
+            ParameterEditor.EditType.Complex: ComplexValidator(None),
+            }
+    return shared_validator.validators.get(typ)
+
+
+def editor_icon(name, size=None):
+    """
+    Get the editor's icon.
+
+    Icons are loaded once and cached.
+
+    Arguments:
+        name (str): Icon file name.
+        size (Optional[int]): Icon size. Defaults to *None* (original
+            size).
+
+    Returns:
+        QIcon: Icon object.
+    """
+    if not hasattr(editor_icon, "icons"):
+        editor_icon.icons = {}
+    key = (name, size)
+    icon = editor_icon.icons.get(key)
+    if icon is None:
+        icon = load_icon(name, size=size)
+        if icon is not None:
+            editor_icon.icons[key] = icon
+    return icon
+
+
+def editor_tooltip(icon, description):
+    """
+    Get the tooltip item for the editor's switch button.
+
+    Formatted tooltips are cached.
+
+    Arguments:
+        icon (str): Icon file name.
+        description (str): Description of the editor.
+
+    Returns:
+        str: Tooltip item in HTML format.
+    """
+    if not hasattr(editor_tooltip, "tips"):
+        editor_tooltip.tips = {}
+    key = (icon, description)
+    tip = editor_tooltip.tips.get(key)
+    if tip is None:
+        tip = image(CFG.rcfile(icon)) + \
+            wrap_html(" " + italic(description), "span")
+        editor_tooltip.tips[key] = tip
+    return tip
+
+
+def is_datastructure(typ, name):
+    """
+    Check if keyword type is a subclass of given catalog *DataStructure*
+    class.
+
+    Results are cached per type and class name.
+
+    Arguments:
+        typ (any): Keyword type ('typ' attribute of keyword definition).
+        name (str): Name of *DataStructure* class, e.g. 'ASSD'.
+
+    Returns:
+        bool: *True* if `typ` is a subclass of given class; *False*
+        otherwise.
+    """
+    if not hasattr(is_datastructure, "cache"):
+        is_datastructure.cache = {}
+    key = (typ, name)
+    res = is_datastructure.cache.get(key)
+    if res is None:
+        datastructure = CATA.package('DataStructure')
+        res = is_subclass(typ, getattr(datastructure, name))
+        is_datastructure.cache[key] = res
+    return res
+
+
+def editor_switch_menu():
+    """
+    Get menu shared by switch buttons of all editor stacks.
+
+    The menu is filled by the stack when its switch button is pressed.
+
+    Returns:
+        QMenu: Editor switch menu.
+    """
+    if not hasattr(editor_switch_menu, "menu"):
+        editor_switch_menu.menu = QMenu()
+    return editor_switch_menu.menu
+
+
 class ParameterEditor(QWidget):
     """Base class for editor widgets."""
 
@@ -207,6 +489,12 @@ class ParameterEditor(QWidget):
     linkActivated = pyqtSignal(str)
     """Signal: emitted when sub-editor is activated."""
 
+    reusable = False
+    """Flag: editor can be given back by factory after release."""
+
+    _pending = set()
+    """Editors having delayed value change notification."""
+
     def __init__(self, path, parent=None):
         """
         Create editor.
@@ -216,10 +504,85 @@ class ParameterEditor(QWidget):
         """
         super(ParameterEditor, self).__init__(parent)
         self._path = path
+        self._ctx_emitter = None
+        self._param_panel = None
+
+        if parent is not None and hasattr(parent, 'editContextChanged'):
+            parent.editContextChanged.connect(self._onEditContextChanged)
+
+    def release(self, holder):
+        """
+        Detach editor from the parameter panel.
+
+        Called by factory when editor is put into the pool.
+        Connections to the editor's signals are removed by its owner.
+
+        Arguments:
+            holder (QWidget): Hidden widget keeping released editors.
+        """
+        parent = self.parent()
+        if parent is not None and hasattr(parent, 'editContextChanged'):
+            disconnect(parent.editContextChanged, self._onEditContextChanged)
+        self._ctx_emitter = None
+        self._param_panel = None
+        self.setParent(holder)
+
+    def reuse(self, path, parent):
+        """
+        Attach released editor to the parameter.
+
+        Can be redefined in subclasses to restore the path dependent
+        state of GUI elements.
+
+        Arguments:
+            path (ParameterPath): Parameter path.
+            parent (QWidget): Parent widget.
+        """
+        self._path = path
+        self._ctx_emitter = None
+        self._param_panel = None
+        self.setParent(parent)
+        self.setEnabled(True)
+        # widget is hidden when its parent is changed
+        self.setVisible(True)
 
         if parent is not None and hasattr(parent, 'editContextChanged'):
             parent.editContextChanged.connect(self._onEditContextChanged)
 
+        self.setValue(None)
+
+    def poolKey(self):
+        """
+        Get key of the editor in the pool of released editors.
+
+        Returns:
+            tuple: Key in the pool of released editors.
+        """
+        return (type(self), id(self.keyword()))
+
+    @staticmethod
+    def flushPending():
+        """
+        Emit delayed value change notifications of all editors.
+
+        Must be called before values of editors are read.
+        """
+        for editor in list(ParameterEditor._pending):
+            editor.flush()
+
+    # pragma pylint: disable=unused-argument
+    def flush(self, notify=True):
+        """
+        Finish delayed value change notification of the editor, if any.
+
+        Default implementation does nothing.
+
+        Arguments:
+            notify (Optional[bool]): If *False*, notification is
+                dropped. Defaults to *True*.
+        """
+        pass
+
     # pragma pylint: disable=no-self-use
     def value(self):
         """
@@ -245,8 +608,25 @@ class ParameterEditor(QWidget):
         """
         pass
 
-    # pragma pylint: disable=no-self-use
-    def icon(self):
+    # pragma pylint: disable=unused-argument
+    @classmethod
+    def accepts(cls, value):
+        """
+        Check if the editor can show given value.
+
+        `setValue()` raises ValueError for the values which are not
+        accepted. Default implementation accepts any value.
+
+        Arguments:
+            value (any): Parameter's value.
+
+        Returns:
+            bool: *True* if value is supported; *False* otherwise.
+        """
+        return True
+
+    @classmethod
+    def icon(cls):
         """
         Get icon associated with the editor.
 
@@ -258,8 +638,8 @@ class ParameterEditor(QWidget):
         """
         return None
 
-    # pragma pylint: disable=no-self-use
-    def description(self):
+    @classmethod
+    def description(cls):
         """
         Get description associated with the editor.
 
@@ -374,7 +754,7 @@ class ParameterEditor(QWidget):
         """
         Returns central view
         """
-        return parameterPanel(self).meshview()
+        return self._parameterPanel().meshview()
 
     def updateTranslations(self):
         """
@@ -394,33 +774,88 @@ class ParameterEditor(QWidget):
         """
         Invoked the notification about edit context changing.
         """
-        obj = None
-        top = self.parent()
-        while obj is None and top is not None:
-            if hasattr(top, 'editContextChanged'):
-                obj = top
-            top = top.parent()
-
+        obj = self._editContextEmitter()
         if obj:
             obj.editContextChanged.emit(context)
 
+    def _editContextEmitter(self):
+        """
+        Get the nearest parent which notifies about edit context changing.
+
+        The parent found is cached until it is destroyed.
+
+        Returns:
+            QWidget: Parent widget with `editContextChanged` signal.
+        """
+        if self._ctx_emitter is None:
+            top = self.parent()
+            while top is not None:
+                if hasattr(top, 'editContextChanged'):
+                    self._ctx_emitter = top
+                    top.destroyed.connect(self._onEditContextEmitterDestroyed)
+                    break
+                top = top.parent()
+        return self._ctx_emitter
+
+    def _onEditContextEmitterDestroyed(self):
+        self._ctx_emitter = None
+
+    def _parameterPanel(self):
+        """
+        Get the parameter panel which the editor belongs to.
+
+        The panel found is cached until it is destroyed.
+
+        Returns:
+            ParameterPanel: Parameter panel.
+        """
+        if self._param_panel is None:
+            self._param_panel = parameterPanel(self)
+            if self._param_panel is not None:
+                self._param_panel.destroyed.connect(
+                    self._onParameterPanelDestroyed)
+        return self._param_panel
+
+    def _onParameterPanelDestroyed(self):
+        self._param_panel = None
+
     def _onEditContextChanged(self, context):
         self.updateEditContext(context)
 
+    @pyqtSlot()
+    def _emitChanged(self):
+        """
+        Emit `valueChanged` signal.
+
+        Used as an intermediate slot for the widget signals that carry
+        an argument, to avoid wrapping it into Python object on each
+        emission.
+        """
+        self.valueChanged.emit()
+
 
 class ParameterEditorStack(ParameterEditor):
     """Stack for editor widgets."""
 
-    def __init__(self, edits, parent=None):
+    def __init__(self, creators, path, parent=None):
         """
         Create editor stack.
 
+        Only the first editor is created immediately, the others are
+        built on demand, when they become current.
+
         Arguments:
+            creators (list[ParameterEditorFactoryCreator]): Creators of
+                alternative editors.
+            path (ParameterPath): Parameter keyword catalog path.
             parent (Optional[QWidget]): Parent widget.
         """
-        super(ParameterEditorStack, self).\
-            __init__(edits[0].path() if edits is not None and len(edits) \
-                         else ParameterPath(None), parent)
+        super(ParameterEditorStack, self).__init__(path, parent)
+
+        self._parent = parent
+        self._creators = creators
+        self._editors = [None] * len(creators)
+        self._depends = {}
 
         base = QHBoxLayout(self)
         base.setContentsMargins(0, 0, 0, 0)
@@ -433,37 +868,31 @@ class ParameterEditorStack(ParameterEditor):
         base.addWidget(self._switch)
 
         tips = []
-        menu = QMenu(self)
-        for e in edits:
-            icon = load_icon(e.icon())
-            menu.addAction(icon, "").\
-                setObjectName(str(self._stack.count()))
+        menu = editor_switch_menu()
+        for creator in creators:
+            icon = editor_icon(creator.icon())
 
-            self._stack.addWidget(e)
+            self._stack.addWidget(QWidget(self._stack))
 
             tbar = QToolBar(self._switch)
             tbar.setToolButtonStyle(Qt.ToolButtonIconOnly)
             btn = QToolButton(tbar)
             tbar.addWidget(btn)
-            btn.setObjectName(self.path().name() + "-%s" % e.icon())
+            btn.setObjectName(self.path().name() + "-%s" % creator.icon())
             btn.setIcon(icon)
             btn.setMenu(menu)
             self._switch.addWidget(tbar)
 
-            tips.append(image(CFG.rcfile(e.icon())) +
-                        wrap_html(" " + italic(e.description()), "span"))
+            tips.append(editor_tooltip(creator.icon(), creator.description()))
 
             btn.clicked.connect(self._onSwitchClicked)
-            e.valueChanged.connect(self._onValueChanged)
-            e.linkActivated.connect(self._onLinkActivated)
+            btn.pressed.connect(self._onSwitchPressed)
 
         if len(tips) > 0:
             self._switch.setToolTip("<br>".join(tips))
 
-        margin = menu.style().pixelMetric(QStyle.PM_MenuHMargin)
-        menu.setFixedWidth(self._switch.sizeHint().width() + 2 * margin)
-        menu.triggered.connect(self._onMenuTriggered)
-
+        if len(creators) > 0:
+            self._connectEditor(self._editor(0))
         self._switchEditor(0)
 
     def currentEditor(self):
@@ -475,6 +904,19 @@ class ParameterEditorStack(ParameterEditor):
         """
         return self._stack.currentWidget()
 
+    def flush(self, notify=True):
+        """
+        Finish delayed value change notification of sub-editors.
+
+        Arguments:
+            notify (Optional[bool]): If *False*, notification is
+                dropped. Defaults to *True*.
+        """
+        current = self.currentEditor()
+        for editor in self._editors:
+            if editor is not None:
+                editor.flush(notify and editor is current)
+
     # pragma pylint: disable=no-self-use
     def value(self):
         """
@@ -500,13 +942,11 @@ class ParameterEditorStack(ParameterEditor):
             value (any): Parameter's value.
         """
         index = -1
-        for i in xrange(self._stack.count()):
-            try:
-                self._stack.widget(i).setValue(value)
+        for i, creator in enumerate(self._creators):
+            if creator.accepts(value):
+                self._editor(i).setValue(value)
                 index = i
                 break
-            except ValueError:
-                pass
 
         self._switchEditor(index)
 
@@ -548,8 +988,10 @@ class ParameterEditorStack(ParameterEditor):
             path (ParameterPath): Path of keyword which was changed
             value: Changed value
         """
-        for i in xrange(self._stack.count()):
-            self._stack.widget(i).dependValue(path, value)
+        self._depends[path.path()] = (path, value)
+        for editor in self._editors:
+            if editor is not None:
+                editor.dependValue(path, value)
 
     def forceNoDefault(self):
         """
@@ -570,37 +1012,169 @@ class ParameterEditorStack(ParameterEditor):
         Update translations in GUI elements.
         Can be redefined in subclasses.
         """
-        for i in xrange(self._stack.count()):
-            self._stack.widget(i).updateTranslations()
+        for editor in self._editors:
+            if editor is not None:
+                editor.updateTranslations()
 
     def _onSwitchClicked(self):
         index = self._switch.indexOf(self.sender().parent()) + 1
-        if index >= self._stack.count():
+        if index >= len(self._editors):
             index = 0
         self._switchEditor(index)
 
+    def _onSwitchPressed(self):
+        """
+        Fill shared switch menu with the editors of this stack.
+        """
+        menu = editor_switch_menu()
+        disconnect(menu.triggered)
+        menu.clear()
+        for index, creator in enumerate(self._creators):
+            menu.addAction(editor_icon(creator.icon()), "").\
+                setObjectName(str(index))
+        margin = menu.style().pixelMetric(QStyle.PM_MenuHMargin)
+        menu.setFixedWidth(self._switch.sizeHint().width() + 2 * margin)
+        menu.triggered.connect(self._onMenuTriggered)
+
     def _onMenuTriggered(self, action):
         index = int(action.objectName())
         self._switchEditor(index)
 
-    def _onValueChanged(self):
-        if self.sender() == self.currentEditor():
-            self.valueChanged.emit()
+    def _connectEditor(self, editor):
+        """
+        Forward signals of given sub-editor directly to the stack.
+        """
+        if editor is not None:
+            connect(editor.valueChanged, self.valueChanged)
+            connect(editor.linkActivated, self.linkActivated)
+
+    def _disconnectEditor(self, editor):
+        """
+        Stop forwarding signals of given sub-editor to the stack.
+        """
+        if editor is not None:
+            disconnect(editor.valueChanged, self.valueChanged)
+            disconnect(editor.linkActivated, self.linkActivated)
+
+    def _editor(self, index):
+        """
+        Get the editor with given index, create it if necessary.
+
+        Arguments:
+            index (int): Editor index.
 
-    def _onLinkActivated(self, link):
-        if self.sender() == self.currentEditor():
-            self.linkActivated.emit(link)
+        Returns:
+            ParameterEditor: Editor widget.
+        """
+        editor = self._editors[index]
+        if editor is None:
+            editor = self._creators[index].createEditor(self.path(),
+                                                        self._parent)
+            for path, value in self._depends.itervalues():
+                editor.dependValue(path, value)
+
+            current = self._stack.currentIndex()
+            placeholder = self._stack.widget(index)
+            self._stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self._stack.insertWidget(index, editor)
+            self._stack.setCurrentIndex(current)
+            self._editors[index] = editor
+        return editor
 
     def _switchEditor(self, index):
-        if index >= 0 and index < self._stack.count() \
+        if index >= 0 and index < len(self._editors) \
                 and self._stack.currentIndex() != index:
+            self._editor(index)
+            self._disconnectEditor(self.currentEditor())
             self._stack.setCurrentIndex(index)
             self._switch.setCurrentIndex(index)
-            self._onValueChanged()
+            self._connectEditor(self.currentEditor())
+            self.valueChanged.emit()
+
+
+class EditorFrame(QFrame):
+    """Raised panel frame holding the widgets of compound editors."""
+
+    style = QFrame.Panel | QFrame.Raised
+    """Frame style shared by all editor frames."""
+
+    def __init__(self, parent=None):
+        """
+        Create frame with an empty horizontal layout.
+
+        Arguments:
+            parent (Optional[QWidget]): Parent widget.
+        """
+        super(EditorFrame, self).__init__(parent)
+        self.setFrameStyle(EditorFrame.style)
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+
+class ComboBoxIndex(QObject):
+    """
+    Index of combobox items by their data.
+
+    Replaces `QComboBox.findData()` linear scans: the map from item data
+    to item index is built on demand for each role and dropped as soon
+    as the combobox model changes.
+
+    Index is a child of the combobox, so its connections to the model
+    (which may be shared between comboboxes) are removed together with
+    the combobox.
+    """
+
+    def __init__(self, combobox):
+        """
+        Create index.
+
+        Arguments:
+            combobox (QComboBox): Indexed combobox; the index is bound
+                to the model the combobox has at that moment.
+        """
+        super(ComboBoxIndex, self).__init__(combobox)
+        self._combobox = combobox
+        self._indices = {}
+        model = combobox.model()
+        for signal in (model.rowsInserted, model.rowsRemoved,
+                       model.rowsMoved, model.dataChanged,
+                       model.layoutChanged, model.modelReset):
+            signal.connect(self.clear)
+
+    # pragma pylint: disable=unused-argument
+    def clear(self, *args):
+        """Drop the index."""
+        self._indices.clear()
+
+    def find(self, data, role=Qt.UserRole):
+        """
+        Get index of the first item holding given data.
+
+        Arguments:
+            data (any): Item data.
+            role (Optional[int]): Data role. Defaults to *Qt.UserRole*.
+
+        Returns:
+            int: Item index; -1 if there is no such item.
+        """
+        indices = self._indices.get(role)
+        if indices is None:
+            indices = {}
+            for index in xrange(self._combobox.count() - 1, -1, -1):
+                indices[self._combobox.itemData(index, role)] = index
+            self._indices[role] = indices
+        return indices.get(data, -1)
+
 
 class ComplexValidator(QValidator):
     """Validator for complex editor"""
 
+    regexp = re.compile(r"^\s*({0}|\(\s*({0})\s*\))\s*$".format(
+        r"[+-]?{0}([+-]{0}[jJ])?|[+-]?{0}[jJ]".format(
+            r"(\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?")))
+    """Regular expression matching complex number."""
+
     def __init__(self, lineedit):
         super(ComplexValidator, self).__init__(lineedit)
 
@@ -616,42 +1190,102 @@ class ComplexValidator(QValidator):
         Returns:
             (QValidator.State): Validation result state
         """
-        if to_type(text, complex) is not None:
+        # plain numbers are matched without evaluating the text;
+        # other forms (quoted text, expressions...) are checked by to_type
+        if ComplexValidator.regexp.match(text) or \
+                to_type(text, complex) is not None:
             state = QValidator.Acceptable
         else:
             state = QValidator.Intermediate
         return state, text, pos
 
 
-class ParameterLineEditor(ParameterEditor):
+class ParameterWidgetEditor(ParameterEditor):
+    """
+    Base class for editors made of a single widget.
+
+    The widget fills the whole editor area and is resized directly,
+    without a layout.
+    """
+
+    def __init__(self, path, parent=None):
+        """
+        Create editor.
+
+        Arguments:
+            parent (Optional[QWidget]): Parent widget.
+        """
+        super(ParameterWidgetEditor, self).__init__(path, parent)
+        self.edit = None
+
+    def setEditWidget(self, widget):
+        """
+        Set the widget used for editing.
+
+        Arguments:
+            widget (QWidget): Child widget.
+        """
+        self.edit = widget
+        self.setSizePolicy(widget.sizePolicy())
+        widget.setGeometry(self.rect())
+        self.updateGeometry()
+
+    def sizeHint(self):
+        """Reimplemented to return size hint of edit widget."""
+        return self.edit.sizeHint() if self.edit is not None \
+            else super(ParameterWidgetEditor, self).sizeHint()
+
+    def minimumSizeHint(self):
+        """Reimplemented to return minimum size hint of edit widget."""
+        return self.edit.minimumSizeHint() if self.edit is not None \
+            else super(ParameterWidgetEditor, self).minimumSizeHint()
+
+    def resizeEvent(self, event):
+        """Reimplemented to resize edit widget."""
+        super(ParameterWidgetEditor, self).resizeEvent(event)
+        if self.edit is not None:
+            self.edit.setGeometry(self.rect())
+
+
+class ParameterLineEditor(ParameterWidgetEditor):
     """Simple editor based on line edit widget."""
 
+    reusable = True
+
+    delay = 200
+    """Delay (in ms) between typing in the editor and value notification."""
+
     class Creator(ParameterEditorFactoryCreator):
         """Class for line editor creation."""
 
         # pragma pylint: disable=no-self-use
-        def createEditor(self, path, parent):
+        def isSuitable(self, path):
             """
-            Create editor.
+            Check if the creator provides an editor for given parameter.
 
             Arguments:
                 path: Parameter keyword catalog path.
-                parent (QWidget): parent widget
             """
-            editor = None
-            kw_def = path.keyword()
+            state = False
+            defin = path.keywordDefinition()
             if path.keywordType() == KeywordType.Standard and \
-                    kw_def is not None:
-                defin = kw_def.definition
+                    defin is not None:
                 if 'into' not in defin:
-                    typeid = get_cata_typeid(kw_def)
+                    typeid = path.keywordTypeId()
                     if typeid == IDS.simp:
                         typ_attr = defin.get('typ')
                         if isinstance(typ_attr, (tuple, list)) and typ_attr:
                             typ_attr = typ_attr[0]
                         if typ_attr in ('I', 'R', 'C', 'TXM', 'Fichier'):
-                            editor = ParameterLineEditor(path, parent)
-            return editor
+                            state = True
+            return state
+
+        # pragma pylint: disable=no-self-use
+        def editorClass(self):
+            """
+            Get class of editors built by the creator.
+            """
+            return ParameterLineEditor
 
     def __init__(self, path, parent=None):
         """
@@ -662,31 +1296,47 @@ class ParameterLineEditor(ParameterEditor):
         """
         super(ParameterLineEditor, self).__init__(path, parent)
 
-        self.edit = QLineEdit(self)
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(self.edit)
+        self.setEditWidget(QLineEdit(self))
 
         validator = None
-        kword = self.keyword()
+        defin = self.keywordDefinition()
         typ = self.parameterType()
-        if typ == self.EditType.Int:
-            validator = QIntValidator(self.edit)
-        elif typ == self.EditType.Real:
-            validator = QDoubleValidator(self.edit)
-        elif typ == self.EditType.Complex:
-            validator = ComplexValidator(self.edit)
-
-        if validator is not None:
-            defin = kword.definition
-            if 'val_min' in defin:
-                validator.setBottom(defin.get('val_min'))
-            if 'val_max' in defin:
-                validator.setTop(defin.get('val_max'))
+        if defin is not None and ('val_min' in defin or 'val_max' in defin):
+            if typ == self.EditType.Int:
+                validator = QIntValidator(self.edit)
+            elif typ == self.EditType.Real:
+                validator = QDoubleValidator(self.edit)
+            elif typ == self.EditType.Complex:
+                validator = ComplexValidator(self.edit)
+
+            if validator is not None:
+                if 'val_min' in defin:
+                    validator.setBottom(defin.get('val_min'))
+                if 'val_max' in defin:
+                    validator.setTop(defin.get('val_max'))
+        else:
+            validator = shared_validator(typ)
 
         self.edit.setValidator(validator)
         self.edit.setObjectName(self.name())
-        self.edit.textChanged.connect(self.valueChanged)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(ParameterLineEditor.delay)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+        self.edit.textChanged.connect(self._textChanged)
+        self.edit.installEventFilter(self)
+
+    def reuse(self, path, parent):
+        """
+        Attach released editor to the parameter.
+
+        Arguments:
+            path (ParameterPath): Parameter path.
+            parent (QWidget): Parent widget.
+        """
+        super(ParameterLineEditor, self).reuse(path, parent)
+        self.edit.setObjectName(self.name())
 
     def value(self):
         """
@@ -717,15 +1367,64 @@ class ParameterLineEditor(ParameterEditor):
         Arguments:
             value (int, float, complex or str): Parameter's value.
         """
-        if value is not None and \
-                not isinstance(value, (basestring, int, float, complex)):
+        if not self.accepts(value):
             raise ValueError("Not supported value type")
 
         txt = str(value) if value is not None else ""
-        self.edit.setText(txt)
+        if self.edit.text() != txt:
+            self.flush(False)
+            blocked = self.edit.blockSignals(True)
+            self.edit.setText(txt)
+            self.edit.blockSignals(blocked)
+            self.valueChanged.emit()
 
-    # pragma pylint: disable=no-self-use
-    def icon(self):
+    @classmethod
+    def accepts(cls, value):
+        """
+        Check if the editor can show given value.
+
+        Arguments:
+            value (any): Parameter's value.
+
+        Returns:
+            bool: *True* if value is supported; *False* otherwise.
+        """
+        return value is None or \
+            isinstance(value, (basestring, int, float, complex))
+
+    @pyqtSlot()
+    def flush(self, notify=True):
+        """
+        Finish delayed value change notification, if any.
+
+        Arguments:
+            notify (Optional[bool]): If *False*, notification is
+                dropped. Defaults to *True*.
+        """
+        if self in ParameterEditor._pending:
+            ParameterEditor._pending.discard(self)
+            self._timer.stop()
+            if notify:
+                self.valueChanged.emit()
+
+    def eventFilter(self, obj, event):
+        """
+        Notify about pending value change when line edit loses focus.
+        """
+        if obj == self.edit and event.type() == QEvent.FocusOut:
+            self.flush()
+        return False
+
+    @pyqtSlot()
+    def _textChanged(self):
+        """
+        Called when text is edited; delays value change notification.
+        """
+        ParameterEditor._pending.add(self)
+        self._timer.start()
+
+    @classmethod
+    def icon(cls):
         """
         Get icon associated with the editor.
 
@@ -737,8 +1436,8 @@ class ParameterLineEditor(ParameterEditor):
         """
         return "as_ico_value.png"
 
-    # pragma pylint: disable=no-self-use
-    def description(self):
+    @classmethod
+    def description(cls):
         """
         Get description associated with the editor.
 
@@ -754,26 +1453,35 @@ class ParameterLineEditor(ParameterEditor):
 class ParameterBoolEditor(ParameterEditor):
     """Editor for boolean-like parameter, based on check box widget."""
 
+    reusable = True
+
+    switch = frozenset(("NON", "OUI"))
+    """Values of boolean-like parameter."""
+
     class Creator(ParameterEditorFactoryCreator):
         """Class for check box editor creation."""
 
         # pragma pylint: disable=no-self-use
-        def createEditor(self, path, parent):
+        def isSuitable(self, path):
             """
-            Create editor.
+            Check if the creator provides an editor for given parameter.
 
             Arguments:
                 path: Parameter keyword catalog path.
-                parent (QWidget): parent widget
             """
-            editor = None
-            kw_def = path.keyword()
-            if kw_def is not None:
-                defin = kw_def.definition
-                if 'into' in defin and \
-                        sorted(defin.get('into')) == ["NON", "OUI"]:
-                    editor = ParameterBoolEditor(path, parent)
-            return editor
+            state = False
+            defin = path.keywordDefinition()
+            if defin is not None:
+                if ParameterBoolEditor.isSwitch(defin.get('into')):
+                    state = True
+            return state
+
+        # pragma pylint: disable=no-self-use
+        def editorClass(self):
+            """
+            Get class of editors built by the creator.
+            """
+            return ParameterBoolEditor
 
 
     def __init__(self, path, parent=None):
@@ -784,8 +1492,9 @@ class ParameterBoolEditor(ParameterEditor):
             parent (Optional[QWidget]): Parent widget.
         """
         super(ParameterBoolEditor, self).__init__(path, parent)
+        self._titles = {}
         self.edit = QCheckBox(self)
-        self.edit.stateChanged.connect(self.valueChanged)
+        self.edit.stateChanged.connect(self._emitChanged)
         self.edit.stateChanged.connect(self._stateChanged)
         layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -793,7 +1502,33 @@ class ParameterBoolEditor(ParameterEditor):
         layout.addStretch(1)
 
         self.edit.setObjectName(self.name() + '-value')
-        self._stateChanged()
+        self.updateTranslations()
+
+    def reuse(self, path, parent):
+        """
+        Attach released editor to the parameter.
+
+        Arguments:
+            path (ParameterPath): Parameter path.
+            parent (QWidget): Parent widget.
+        """
+        super(ParameterBoolEditor, self).reuse(path, parent)
+        self.edit.setObjectName(self.name() + '-value')
+        self.updateTranslations()
+
+    @staticmethod
+    def isSwitch(into):
+        """
+        Check if allowed values of the parameter are "OUI" and "NON".
+
+        Arguments:
+            into (list[str]): Allowed values of the parameter.
+
+        Returns:
+            bool: *True* if parameter is boolean-like; *False* otherwise.
+        """
+        return into is not None and len(into) == 2 and \
+            frozenset(into) == ParameterBoolEditor.switch
 
     def value(self):
         """
@@ -811,13 +1546,26 @@ class ParameterBoolEditor(ParameterEditor):
         Arguments:
             value (str): Parameter's value: "OUI" for ON, "NON" for OFF.
         """
-        if value is not None and not isinstance(value, basestring):
+        if not self.accepts(value):
             raise ValueError("Not supported value type")
 
         self.edit.setChecked(value == "OUI")
 
-    # pragma pylint: disable=no-self-use
-    def icon(self):
+    @classmethod
+    def accepts(cls, value):
+        """
+        Check if the editor can show given value.
+
+        Arguments:
+            value (any): Parameter's value.
+
+        Returns:
+            bool: *True* if value is supported; *False* otherwise.
+        """
+        return value is None or isinstance(value, basestring)
+
+    @classmethod
+    def icon(cls):
         """
         Get icon associated with the editor.
 
@@ -829,7 +1577,8 @@ class ParameterBoolEditor(ParameterEditor):
         """
         return "as_ico_value.png"
 
-    def description(self):
+    @classmethod
+    def description(cls):
         """
         Get description associated with the editor.
 
@@ -845,6 +1594,11 @@ class ParameterBoolEditor(ParameterEditor):
         """
         Update translation.
         """
+        title = self.command().title
+        for value in ("OUI", "NON"):
+            self._titles[value] = Options.translate_command(title,
+                                                            self.name(),
+                                                            value)
         self._stateChanged()
 
     @pyqtSlot(int)
@@ -853,35 +1607,40 @@ class ParameterBoolEditor(ParameterEditor):
         Called when check box is switched ON/OFF. Updates check-box's
         title.
         """
-        self.edit.setText(Options.translate_command(self.command().title,
-                                                    self.name(),
-                                                    self.value()))
+        self.edit.setText(self._titles.get(self.value(), ""))
 
 
-class ParameterComboEditor(ParameterEditor):
+class ParameterComboEditor(ParameterWidgetEditor):
     """Editor for selector type parameter, based on combo-box widget."""
 
+    reusable = True
+
     class Creator(ParameterEditorFactoryCreator):
         """Class for combobox editor creation."""
 
         # pragma pylint: disable=no-self-use
-        def createEditor(self, path, parent):
+        def isSuitable(self, path):
             """
-            Create editor.
+            Check if the creator provides an editor for given parameter.
 
             Arguments:
                 path: Parameter keyword catalog path.
-                parent (QWidget): parent widget
             """
-            editor = None
-            kw_def = path.keyword()
+            state = False
+            defin = path.keywordDefinition()
             if path.keywordType() == KeywordType.Standard and \
-                    kw_def is not None:
-                defin = kw_def.definition
+                    defin is not None:
                 if 'into' in defin:
-                    if sorted(defin.get('into')) != ["NON", "OUI"]:
-                        editor = ParameterComboEditor(path, parent)
-            return editor
+                    if not ParameterBoolEditor.isSwitch(defin.get('into')):
+                        state = True
+            return state
+
+        # pragma pylint: disable=no-self-use
+        def editorClass(self):
+            """
+            Get class of editors built by the creator.
+            """
+            return ParameterComboEditor
 
     class ComboBox(QComboBox):
         """Combo box with additional validation after focus out"""
@@ -906,6 +1665,16 @@ class ParameterComboEditor(ParameterEditor):
 
         def __init__(self, combobox):
             super(ParameterComboEditor.Validator, self).__init__(combobox)
+            self._texts = []
+
+        def setItems(self, texts):
+            """
+            Set the texts of combobox items.
+
+            Arguments:
+                texts (list[str]): Items texts.
+            """
+            self._texts = sorted(texts)
 
         def validate(self, text, pos):
             """
@@ -922,8 +1691,9 @@ class ParameterComboEditor(ParameterEditor):
             if len(text) == 0:
                 state = QValidator.Intermediate
             else:
-                idx = self.parent().findText(text, Qt.MatchStartsWith)
-                if idx >= 0 and self.parent().itemText(idx).startswith(text):
+                idx = bisect_left(self._texts, text)
+                if idx < len(self._texts) and \
+                        self._texts[idx].startswith(text):
                     state = QValidator.Acceptable
             return state, text, pos
 
@@ -936,20 +1706,34 @@ class ParameterComboEditor(ParameterEditor):
             parent (Optional[QWidget]): Parent widget.
         """
         super(ParameterComboEditor, self).__init__(path, parent)
-        self.edit = ParameterComboEditor.ComboBox(self)
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(self.edit)
+        self.setEditWidget(ParameterComboEditor.ComboBox(self))
 
         self.edit.setEditable(True)
         self.edit.setInsertPolicy(QComboBox.NoInsert)
-        self.edit.lineEdit().\
-            setValidator(ParameterComboEditor.Validator(self.edit))
+        self._validator = ParameterComboEditor.Validator(self.edit)
+        self.edit.lineEdit().setValidator(self._validator)
+        self._items = ComboBoxIndex(self.edit)
+        self._sorted = (None, None)
 
         self._updateList()
 
         self.edit.setObjectName(self.name())
-        self.edit.currentIndexChanged.connect(self.valueChanged)
+        self.edit.currentIndexChanged.connect(self._emitChanged)
+
+        if self.edit.count() == 1:
+            self.edit.setCurrentIndex(0)
+
+    def reuse(self, path, parent):
+        """
+        Attach released editor to the parameter.
+
+        Arguments:
+            path (ParameterPath): Parameter path.
+            parent (QWidget): Parent widget.
+        """
+        super(ParameterComboEditor, self).reuse(path, parent)
+        self._updateList()
+        self.edit.setObjectName(self.name())
 
         if self.edit.count() == 1:
             self.edit.setCurrentIndex(0)
@@ -982,20 +1766,35 @@ class ParameterComboEditor(ParameterEditor):
             value (int, float, complex or str): Parameter's value.
         """
 
-        if value is not None and \
-                not isinstance(value, (basestring, int, float, complex)):
+        if not self.accepts(value):
             raise ValueError("Not supported value type")
 
+        index = self.edit.currentIndex()
         if isinstance(value, basestring):
-            index = self.edit.findData(value)
-            if index < 0:
-                index = self.edit.findText(value)
-        else:
-            index = self.edit.findText(str(value))
+            if index < 0 or self.edit.itemData(index) != value:
+                index = self._items.find(value)
+                if index < 0:
+                    index = self._items.find(value, Qt.DisplayRole)
+        elif index < 0 or self.edit.itemText(index) != str(value):
+            index = self._items.find(str(value), Qt.DisplayRole)
         self.edit.setCurrentIndex(index)
 
-    # pragma pylint: disable=no-self-use
-    def icon(self):
+    @classmethod
+    def accepts(cls, value):
+        """
+        Check if the editor can show given value.
+
+        Arguments:
+            value (any): Parameter's value.
+
+        Returns:
+            bool: *True* if value is supported; *False* otherwise.
+        """
+        return value is None or \
+            isinstance(value, (basestring, int, float, complex))
+
+    @classmethod
+    def icon(cls):
         """
         Get icon associated with the editor.
 
@@ -1007,7 +1806,8 @@ class ParameterComboEditor(ParameterEditor):
         """
         return "as_ico_value.png"
 
-    def description(self):
+    @classmethod
+    def description(cls):
         """
         Get description associated with the editor.
 
@@ -1034,45 +1834,121 @@ class ParameterComboEditor(ParameterEditor):
         if kw_def is not None:
             lst = kw_def.get('into')
 
-        show_ident = behavior().show_selector_value
-        sort_lists = behavior().sort_selector_values
+        props = behavior()
+        show_ident = props.show_selector_value
+        sort_lists = props.sort_selector_values
 
         if lst is not None:
             if sort_lists:
-                lst = sorted(lst)
-            current = self.edit.currentIndex()
-            self.edit.clear()
+                lst = self._sortedList(lst)
+            command = self.command().title
+            name = self.name()
+            items = []
             for value in lst:
                 if isinstance(value, basestring):
-                    title = Options.translate_command(self.command().title,
-                                                      self.name(), value)
+                    title = Options.translate_command(command, name, value)
                     if title != value and show_ident:
                         title = "{0} ({1})".format(title, value)
-                    self.edit.addItem(title, value)
+                    items.append((title, value))
                 else:
-                    self.edit.addItem(str(value))
-            self.edit.setCurrentIndex(current)
+                    items.append((str(value), None))
+            self._validator.setItems([item[0] for item in items])
+            self._setItems(items, self.edit.currentIndex())
+
+    def _sortedList(self, lst):
+        """
+        Get sorted copy of the list of values.
+
+        Sorted list is cached while the same list is requested, so
+        repeated updates of the combobox (e.g. on translations
+        change) do not sort it again.
+
+        Arguments:
+            lst (list): List of values.
+
+        Returns:
+            list: Sorted values.
+        """
+        if self._sorted[0] is not lst:
+            self._sorted = (lst, sorted(lst))
+        return self._sorted[1]
+
+    def _setItems(self, items, current):
+        """
+        Set items into the combobox.
+
+        Only items which differ from the existing ones are modified.
+        Combobox signals are blocked during update; if current item is
+        changed, combobox emits its change signals once after update.
+
+        Arguments:
+            items (list[tuple[str, any]]): Items titles and data.
+            current (int): Index of item to make current.
+        """
+        edit = self.edit
+        index = edit.currentIndex()
+        data = edit.itemData(index)
+        text = edit.itemText(index)
+        if current >= len(items):
+            current = -1
+
+        blocked = edit.blockSignals(True)
+        count = edit.count()
+        for i, item in enumerate(items[:count]):
+            if edit.itemText(i) != item[0]:
+                edit.setItemText(i, item[0])
+            if edit.itemData(i) != item[1]:
+                edit.setItemData(i, item[1])
+        if len(items) > count:
+            # insert new items at once, then set their data
+            edit.insertItems(count, [item[0] for item in items[count:]])
+            for i, item in enumerate(items[count:], count):
+                if item[1] is not None:
+                    edit.setItemData(i, item[1])
+        elif len(items) < count:
+            model = edit.model()
+            model.removeRows(len(items), count - len(items))
+        changed = current != index or edit.itemData(current) != data \
+            or edit.itemText(current) != text
+        if changed:
+            # reset current item, so that combobox emits all its
+            # change signals when new current item is set below
+            edit.setCurrentIndex(-1 if current >= 0 else 0)
+        else:
+            edit.setCurrentIndex(current)
+        edit.blockSignals(blocked)
+
+        if changed:
+            edit.setCurrentIndex(current)
 
 
 class ParameterMEDSelectEditor(ParameterComboEditor):
     """Editor for NOM_MED, based on combo-box widget."""
 
+    reusable = False
+
     class Creator(ParameterEditorFactoryCreator):
         """Class for MED mesh selection creation."""
 
         # pragma pylint: disable=no-self-use
-        def createEditor(self, path, parent):
+        def isSuitable(self, path):
             """
-            Create editor.
+            Check if the creator provides an editor for given parameter.
 
             Arguments:
                 path: Parameter keyword catalog path.
-                parent (QWidget): parent widget
             """
-            editor = None
+            state = False
             if path.keywordType() == KeywordType.MeshName:
-                editor = ParameterMEDSelectEditor(path, parent)
-            return editor
+                state = True
+            return state
+
+        # pragma pylint: disable=no-self-use
+        def editorClass(self):
+            """
+            Get class of editors built by the creator.
+            """
+            return ParameterMEDSelectEditor
 
     updateMeshView = pyqtSignal(str, str, float, bool)
     """Signal: emitted when sub-editor is activated."""
@@ -1085,12 +1961,14 @@ class ParameterMEDSelectEditor(ParameterComboEditor):
             parent (Optional[QWidget]): Parent widget.
         """
         self._file = None
+        self._shown_mesh = None
         super(ParameterMEDSelectEditor, self).__init__(path, parent)
         self.edit.setEditable(False)
         self.edit.currentTextChanged.connect(self.meshNameToChange)
         self.updateMeshView.connect(self.meshview().displayMEDFileName)
 
-    def description(self):
+    @classmethod
+    def description(cls):
         """
         Get description associated with the editor.
 
@@ -1111,7 +1989,7 @@ class ParameterMEDSelectEditor(ParameterComboEditor):
             value: Changed value
         """
         if path.keywordType() == KeywordType.FileName:
-            self._file = value.values()[0]
+            self._file = next(value.itervalues())
 
             curvalue = self.value()
             self._updateList()
@@ -1136,11 +2014,18 @@ class ParameterMEDSelectEditor(ParameterComboEditor):
         Emits `updateMeshView` signal whenever value in combo box is changed
         """
         if self.edit.isEnabled():
+            # mesh is shown again if the file was regenerated
+            shown = (self._file, file_mtime(self._file), meshname)
+            if shown == self._shown_mesh:
+                return
+            self._shown_mesh = shown
             self.updateMeshView.emit(self._file, meshname, 1.0, False)
 
 class ParameterCommandSelectEditor(ParameterComboEditor):
     """Editor for selector type parameter, based on combo-box widget."""
 
+    reusable = False
+
     updateMeshView = pyqtSignal(str, str, float, bool)
     """Signal: emitted when sub-editor is activated."""
 
@@ -1148,16 +2033,17 @@ class ParameterCommandSelectEditor(ParameterComboEditor):
         """Class for factor editor creation."""
 
         # pragma pylint: disable=no-self-use
-        def createEditor(self, path, parent):
+        def isSuitable(self, path):
             """
-            Create editor.
+            Check if the creator provides an editor for given parameter.
 
             Arguments:
                 path: Parameter keyword catalog path.
-                parent (QWidget): parent widget
             """
-            editor = None
-            kw_def = path.keyword().definition
+            kw_def = path.keywordDefinition()
+            if kw_def is None:
+                return False
+            state = False
             typ = kw_def.get('typ')
             if isinstance(typ, (tuple, list)):
                 if len(typ) > 0:
@@ -1167,10 +2053,17 @@ class ParameterCommandSelectEditor(ParameterComboEditor):
                 else:
                     typ = None
 
-            if is_subclass(typ, CATA.package('DataStructure').ASSD) and \
+            if is_datastructure(typ, 'ASSD') and \
                     typ is not CATA.package('DataStructure').CO:
-                editor = ParameterCommandSelectEditor(path, parent)
-            return editor
+                state = True
+            return state
+
+        # pragma pylint: disable=no-self-use
+        def editorClass(self):
+            """
+            Get class of editors built by the creator.
+            """
+            return ParameterCommandSelectEditor
 
     def __init__(self, path, parent=None):
         """
@@ -1180,6 +2073,10 @@ class ParameterCommandSelectEditor(ParameterComboEditor):
             parent (Optional[QWidget]): Parent widget.
         """
         self.cmdlist = []
+        self._commands = {}
+        self._meshes = {}
+        self._titles = None
+        self._cmdlist_valid = False
         super(ParameterCommandSelectEditor, self).__init__(path, parent)
         self.edit.setEditable(False)
 
@@ -1190,8 +2087,8 @@ class ParameterCommandSelectEditor(ParameterComboEditor):
         self.edit.activated.connect(self.conceptChanged)
         self.updateMeshView.connect(self.meshview().displayMEDFileName)
 
-    # pragma pylint: disable=no-self-use
-    def icon(self):
+    @classmethod
+    def icon(cls):
         """
         Get icon associated with the editor.
 
@@ -1203,7 +2100,8 @@ class ParameterCommandSelectEditor(ParameterComboEditor):
         """
         return "as_ico_command.png"
 
-    def description(self):
+    @classmethod
+    def description(cls):
         """
         Get description associated with the editor.
 
@@ -1215,39 +2113,85 @@ class ParameterCommandSelectEditor(ParameterComboEditor):
         """
         return translate("ParameterPanel", "Select existing result")
 
+    def updateTranslations(self):
+        """
+        Update translation.
+        """
+        self._titles = None
+        super(ParameterCommandSelectEditor, self).updateTranslations()
+
+    def _title(self, key):
+        """
+        Get translated title of a special item.
+
+        Titles are translated once and cached until translations
+        are updated.
+
+        Arguments:
+            key (str): Title key.
+
+        Returns:
+            str: Translated title.
+        """
+        if self._titles is None:
+            self._titles = self._translateTitles()
+        return self._titles[key]
+
+    # pragma pylint: disable=no-self-use
+    def _translateTitles(self):
+        """
+        Translate titles of special items.
+
+        Returns:
+            dict[str, str]: Translated titles.
+        """
+        return {'variable': translate("ParameterPanel", "Variable"),
+                'noobj': translate("ParameterPanel", "<no object selected>")}
+
     def _updateList(self):
         """
         Updates the list in the combobox
         """
-        self.cmdlist = []
-        kw_def = self.keywordDefinition()
-        if self.path() is not None:
-            self.cmdlist = self.path().command().groupby(kw_def.get('typ'))
-
-        self.cmdlist = self._reorderList(self.cmdlist)
+        if not self._cmdlist_valid:
+            self._updateCommands()
 
         current = self.edit.currentIndex()
 
-        self.edit.clear()
+        items = self._specialItems()
         show_title = behavior().show_catalogue_name_in_selectors
         title_mask = '{n} ({t})' if show_title else '{n}'
-        vartit = translate("ParameterPanel", "Variable")
+        vartit = self._title('variable')
         for cmd in self.cmdlist:
             ctitle = vartit if cmd.title == "_CONVERT_VARIABLE" else cmd.title
             title = title_mask.format(n=cmd.name, t=ctitle)
-            self.edit.addItem(title, cmd.uid)
-
-        specials = self._specialItems()
-        specials.reverse()
-        for j in xrange(len(specials)):
-            pair = specials[j]
-            self.edit.insertItem(0, pair[0], pair[1])
+            items.append((title, cmd.uid))
 
         if current < 0:
             current = 0
-        self.edit.setCurrentIndex(current)
+        self._setItems(items, current)
+
+    def _updateCommands(self):
+        """
+        Collect the commands which can be selected in the editor.
+        """
+        self.cmdlist = []
+        kw_def = self.keywordDefinition()
+        if self.path() is not None:
+            self.cmdlist = self.path().command().groupby(kw_def.get('typ'))
+
+        self.cmdlist = self._reorderList(self.cmdlist)
+        self._commands = dict((cmd.uid, cmd) for cmd in self.cmdlist)
+        self._meshes = {}
+        self._cmdlist_valid = True
+
+    def _invalidateCommands(self):
+        """
+        Mark the list of commands as outdated.
+
+        The commands are collected again on next update of the list.
+        """
+        self._cmdlist_valid = False
 
-    # pragma pylint: disable=no-self-use
     def _specialItems(self):
         """
         Gets the special selector items.
@@ -1255,9 +2199,7 @@ class ParameterCommandSelectEditor(ParameterComboEditor):
         Returns:
             [(str, int)]: list of pairs name and id.
         """
-        noobj = translate("ParameterPanel",
-                          "<no object selected>")
-        return [(noobj, 0)]
+        return [(self._title('noobj'), 0)]
 
     # pragma pylint: disable=no-self-use
     def _reorderList(self, lst):
@@ -1279,14 +2221,8 @@ class ParameterCommandSelectEditor(ParameterComboEditor):
         Returns:
             str: Value chosen by the user.
         """
-        cmd = None
-        idx = self.edit.currentIndex()
-        data = self.edit.itemData(idx)
-        for c in self.cmdlist:
-            if c.uid == data:
-                cmd = c
-                break
-        return cmd
+        data = self.edit.itemData(self.edit.currentIndex())
+        return self._commands.get(data)
 
     def setValue(self, value):
         """
@@ -1295,29 +2231,79 @@ class ParameterCommandSelectEditor(ParameterComboEditor):
         Arguments:
             value (str): Parameter's value.
         """
-        if value is not None and \
-                not isinstance(value, Command):
+        if not self.accepts(value):
             raise ValueError("Not supported value type")
 
         index = 0
         if value is not None:
-            index = self.edit.findData(value.uid)
-            if index < 0:
-                index = 0
+            index = self.edit.currentIndex()
+            if self.edit.itemData(index) != value.uid:
+                index = self._items.find(value.uid)
+                if index < 0:
+                    index = 0
         self.edit.setCurrentIndex(index)
 
-    def meshlist(self):
+    @classmethod
+    def accepts(cls, value):
+        """
+        Check if the editor can show given value.
+
+        Arguments:
+            value (any): Parameter's value.
+
+        Returns:
+            bool: *True* if value is supported; *False* otherwise.
+        """
+        return value is None or isinstance(value, Command)
+
+    def meshlist(self):
+        """
+        Meshes available from `cmdlist` that can be displayed.
+        """
+        meshlist = []
+        for cmd in self.cmdlist:
+            for mesh, filename, _ in self._availMeshes(cmd):
+                if filename:
+                    meshlist.append(mesh)
+        return meshlist
+
+    def _availMeshes(self, cmd):
+        """
+        Get meshes the command depends on, along with their MED file and
+        mesh names.
+
+        The result is cached until the commands list is updated.
+
+        Arguments:
+            cmd (Command): Command.
+
+        Returns:
+            list[tuple[Command, str, str]]: Mesh commands with the MED
+            file name and mesh name (see `get_cmd_mesh()`).
+        """
+        if cmd is None:
+            return []
+        meshes = self._meshes.get(cmd.uid)
+        if meshes is None:
+            from datamodel.command.helper import avail_meshes_in_cmd
+            meshes = [(mesh,) + tuple(get_cmd_mesh(mesh))
+                      for mesh in avail_meshes_in_cmd(cmd)]
+            self._meshes[cmd.uid] = meshes
+        return meshes
+
+    def _hasMeshes(self):
         """
-        Meshes available from `cmdlist` that can be displayed.
+        Check if any of the commands in `cmdlist` provides mesh that can be
+        displayed.
+
+        Returns:
+            bool: *True* if there's a mesh to display; *False* otherwise.
         """
-        meshlist = []
         for cmd in self.cmdlist:
-            meshes = avail_meshes_in_cmd(cmd)
-            for mesh in meshes:
-                filename, _ = get_cmd_mesh(mesh)
+            for _, filename, _ in self._availMeshes(cmd):
                 if filename:
-                    meshlist.append(mesh)
-        return meshlist
+                    return True
+        return False
 
     @pyqtSlot(int)
     def conceptChanged(self, _):
@@ -1328,11 +2314,8 @@ class ParameterCommandSelectEditor(ParameterComboEditor):
         Arguments:
             idx (int): new index in the combo box.
         """
-        meshes = avail_meshes_in_cmd(self.value())
-
-        if self.meshlist():
-            for mesh in meshes:
-                filename, meshname = get_cmd_mesh(mesh)
+        if self._hasMeshes():
+            for _, filename, meshname in self._availMeshes(self.value()):
                 if self.edit.isEnabled() and filename:
                     self.updateMeshView.emit(filename, meshname, 1.0, False)
 
@@ -1344,18 +2327,24 @@ class ParameterFilePathEditor(ParameterEditor):
         """Class for custom editor creation."""
 
         # pragma pylint: disable=no-self-use
-        def createEditor(self, path, parent):
+        def isSuitable(self, path):
             """
-            Create editor.
+            Check if the creator provides an editor for given parameter.
 
             Arguments:
                 path: Parameter keyword catalog path.
-                parent (QWidget): parent widget
             """
-            editor = None
+            state = False
             if path.keywordType() == KeywordType.FileName:
-                editor = ParameterFilePathEditor(path, parent)
-            return editor
+                state = True
+            return state
+
+        # pragma pylint: disable=no-self-use
+        def editorClass(self):
+            """
+            Get class of editors built by the creator.
+            """
+            return ParameterFilePathEditor
 
     meshFileChanged = pyqtSignal(str, str, float, bool)
     """Signal: emitted when sub-editor is activated."""
@@ -1371,11 +2360,13 @@ class ParameterFilePathEditor(ParameterEditor):
         self._parent = parent
         self.storage = None
         self._prev_index = None
+        self._shown_mesh = None
         self.edit = QComboBox(self)
 
-        model = parameterPanel(self).unitModel()
+        self._model = self._parameterPanel().unitModel()
 
-        self.edit.setModel(model)
+        self.edit.setModel(self._model)
+        self._items = ComboBoxIndex(self.edit)
         self.edit.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
         self.edit.setObjectName(self.name())
         self.edit.currentIndexChanged.connect(self.valueChanged)
@@ -1395,10 +2386,12 @@ class ParameterFilePathEditor(ParameterEditor):
         self.umin = kw_def.get('val_min')
         self.umax = kw_def.get('val_max')
 
-        model.rowsAboutToBeInserted.connect(self._beforeUpdate)
-        model.rowsInserted.connect(self._afterUpdate)
-        model.rowsAboutToBeRemoved.connect(self._beforeUpdate)
-        model.rowsRemoved.connect(self._afterUpdate)
+        self._model.rowsAboutToBeInserted.connect(self._beforeUpdate)
+        self._model.rowsInserted.connect(self._afterUpdate)
+        self._model.rowsAboutToBeRemoved.connect(self._beforeUpdate)
+        self._model.rowsRemoved.connect(self._afterUpdate)
+        self._model.modelReset.connect(self._resetShownMesh)
+        self._model.dataChanged.connect(self._resetShownMesh)
         self.valueChanged.connect(self.updateMeshView)
         self.meshFileChanged.connect(self.meshview().displayMEDFileName)
 
@@ -1421,9 +2414,11 @@ class ParameterFilePathEditor(ParameterEditor):
             filename (str): File path.
         """
         if filename:
-            index = self.edit.findData(filename, Role.CustomRole)
+            if filename == self.currentFilename():
+                return
+            index = self._items.find(filename, Role.CustomRole)
             if index == -1:
-                if self.edit.model().basename_conflict(filename):
+                if self._model.basename_conflict(filename):
                     # Set "UnitPanel" as context to avoid duplicate translation
                     #     with `UnitPanel.setCurrentFilename`.
                     # If you change the message text below,
@@ -1437,10 +2432,10 @@ class ParameterFilePathEditor(ParameterEditor):
                                          msg.format(os.path.basename(filename)))
                     return
                 try:
-                    unit = self.edit.model().addItem(filename,
-                                                     self.udefault,
-                                                     self.umin,
-                                                     self.umax)
+                    unit = self._model.addItem(filename,
+                                               self.udefault,
+                                               self.umin,
+                                               self.umax)
                 except ValueError:
                     msg = translate("ParameterPanel",
                                     "Could not find available file"
@@ -1449,10 +2444,12 @@ class ParameterFilePathEditor(ParameterEditor):
                     QMessageBox.critical(self, "AsterStudy",
                                          msg % (self.umin, self.umax))
                 else:
-                    self.edit.setCurrentIndex(self.edit.findData(unit,
-                                                                 Role.IdRole))
+                    self.edit.setCurrentIndex(self._items.find(unit,
+                                                               Role.IdRole))
             else:
                 self.edit.setCurrentIndex(index)
+        elif self.edit.currentIndex() == 0:
+            return
         else:
             self.edit.setCurrentIndex(0)
         self.valueChanged.emit()
@@ -1466,10 +2463,10 @@ class ParameterFilePathEditor(ParameterEditor):
             return None
         unit = self.edit.itemData(index, Role.IdRole)
         if unit < -1:
-            unit = self.edit.model().file2unit(self.currentFilename(),
-                                               self.udefault,
-                                               self.umin,
-                                               self.umax)
+            unit = self._model.file2unit(self.currentFilename(),
+                                         self.udefault,
+                                         self.umin,
+                                         self.umax)
         return unit
 
     def setCurrentUnit(self, unit):
@@ -1479,12 +2476,15 @@ class ParameterFilePathEditor(ParameterEditor):
         Arguments:
             unit (int): File unit.
         """
-        index = self.edit.findData(unit, Role.IdRole)
+        index = self._items.find(unit, Role.IdRole)
+        if index == self.edit.currentIndex() and \
+                (index != -1 or unit is None):
+            return
         if index == -1 and unit is not None:
             try:
-                newunit = self.edit.model().addItem(None, unit,
-                                                    self.umin, self.umax)
-                index = self.edit.findData(newunit, Role.IdRole)
+                newunit = self._model.addItem(None, unit,
+                                              self.umin, self.umax)
+                index = self._items.find(newunit, Role.IdRole)
             except ValueError:
                 msg = translate("ParameterPanel",
                                 "Could not find available file"
@@ -1534,15 +2534,29 @@ class ParameterFilePathEditor(ParameterEditor):
         Arguments:
             value (str): Parameter's value.
         """
-        if value and isinstance(value, dict):
-            value = value.keys()[0]
-
-        if value is not None and \
-                not isinstance(value, int):
+        if not self.accepts(value):
             raise ValueError("Not supported value type")
 
+        if value and isinstance(value, dict):
+            value = next(iter(value))
+
         self.setCurrentUnit(value)
 
+    @classmethod
+    def accepts(cls, value):
+        """
+        Check if the editor can show given value.
+
+        Arguments:
+            value (any): Parameter's value.
+
+        Returns:
+            bool: *True* if value is supported; *False* otherwise.
+        """
+        if value and isinstance(value, dict):
+            value = next(iter(value))
+        return value is None or isinstance(value, int)
+
     def forceNoDefault(self):
         """
         This method is used to ignore 'default' attribute of *Unit*
@@ -1558,8 +2572,23 @@ class ParameterFilePathEditor(ParameterEditor):
         """Updates mesh view when value is changed."""
         filename = self.edit.currentData(Role.CustomRole)
         if is_medfile(filename) or is_reference(filename):
+            # mesh is shown again if the file was regenerated
+            shown = (filename, file_mtime(filename))
+            if shown == self._shown_mesh:
+                return
             meshname = get_medfile_meshes(filename)[0]
+            self._shown_mesh = shown
             self.meshFileChanged.emit(filename, meshname, 1.0, False)
+        else:
+            self._shown_mesh = None
+
+    # pragma pylint: disable=unused-argument
+    def _resetShownMesh(self, *args):
+        """
+        Called when files of unit model are changed: mesh of current
+        file must be shown again.
+        """
+        self._shown_mesh = None
 
     # pragma pylint: disable=unused-argument
     @pyqtSlot("QModelIndex", int, int)
@@ -1573,8 +2602,13 @@ class ParameterFilePathEditor(ParameterEditor):
     @pyqtSlot("QModelIndex", int, int)
     def _afterUpdate(self, index, start, end):
         """Called when rows are inserted to model or removed from it."""
-        self.edit.setCurrentIndex(self.edit.findData(self._prev_index,
-                                                     Role.IdRole))
+        # unit model is shared by all file editors of the panel:
+        # combobox keeps track of its current item on its own, so
+        # look for previous unit only if current item was lost
+        if self.edit.currentData(Role.IdRole) == self._prev_index:
+            return
+        self.edit.setCurrentIndex(self._items.find(self._prev_index,
+                                                   Role.IdRole))
 
 
 class ParameterVariableSelectEditor(ParameterCommandSelectEditor):
@@ -1584,28 +2618,32 @@ class ParameterVariableSelectEditor(ParameterCommandSelectEditor):
         """Class for factor editor creation."""
 
         # pragma pylint: disable=no-self-use
-        def createEditor(self, path, parent):
+        def isSuitable(self, path):
             """
-            Create editor.
+            Check if the creator provides an editor for given parameter.
 
             Arguments:
                 path: Parameter keyword catalog path.
-                parent (QWidget): parent widget
             """
-            editor = None
-            kw_def = path.keyword()
-            if kw_def is not None:
-                defin = kw_def.definition
+            state = False
+            defin = path.keywordDefinition()
+            if defin is not None:
                 if 'into' not in defin:
-                    typeid = get_cata_typeid(kw_def)
+                    typeid = path.keywordTypeId()
                     if typeid == IDS.simp:
                         typ_attr = defin.get('typ')
                         if isinstance(typ_attr, (tuple, list)) and typ_attr:
                             typ_attr = typ_attr[0]
                         if typ_attr in ('I', 'R', 'TXM'):
-                            editor = ParameterVariableSelectEditor(path,
-                                                                   parent)
-            return editor
+                            state = True
+            return state
+
+        # pragma pylint: disable=no-self-use
+        def editorClass(self):
+            """
+            Get class of editors built by the creator.
+            """
+            return ParameterVariableSelectEditor
 
     def __init__(self, path, parent=None):
         """
@@ -1619,8 +2657,8 @@ class ParameterVariableSelectEditor(ParameterCommandSelectEditor):
         self.edit.activated.connect(self._onAddVariable)
 
 
-    # pragma pylint: disable=no-self-use
-    def icon(self):
+    @classmethod
+    def icon(cls):
         """
         Get icon associated with the editor.
 
@@ -1629,7 +2667,8 @@ class ParameterVariableSelectEditor(ParameterCommandSelectEditor):
         """
         return "as_ico_variable.png"
 
-    def description(self):
+    @classmethod
+    def description(cls):
         """
         Get description associated with the editor.
 
@@ -1648,17 +2687,30 @@ class ParameterVariableSelectEditor(ParameterCommandSelectEditor):
         Arguments:
             value (str): Parameter's value.
         """
-        if value is not None and \
-                not isinstance(value, Variable):
+        if not self.accepts(value):
             raise ValueError("Not supported value type")
 
         super(ParameterVariableSelectEditor, self).setValue(value)
 
+    @classmethod
+    def accepts(cls, value):
+        """
+        Check if the editor can show given value.
+
+        Arguments:
+            value (any): Parameter's value.
+
+        Returns:
+            bool: *True* if value is supported; *False* otherwise.
+        """
+        return value is None or isinstance(value, Variable)
+
     def updateEditContext(self, context):
         """
         Invoked when edit context changed.
         """
         if context == self.EditContext.Variables:
+            self._invalidateCommands()
             self._updateList()
 
     def _specialItems(self):
@@ -1669,10 +2721,20 @@ class ParameterVariableSelectEditor(ParameterCommandSelectEditor):
             [(str, int)]: list of pairs name and id.
         """
         specs = super(ParameterVariableSelectEditor, self)._specialItems()
-        addvar = translate("ParameterPanel", "<Add Variable...>")
-        specs.append((addvar, -1))
+        specs.append((self._title('addvar'), -1))
         return specs
 
+    def _translateTitles(self):
+        """
+        Translate titles of special items.
+
+        Returns:
+            dict[str, str]: Translated titles.
+        """
+        titles = super(ParameterVariableSelectEditor, self)._translateTitles()
+        titles['addvar'] = translate("ParameterPanel", "<Add Variable...>")
+        return titles
+
     # pragma pylint: disable=no-self-use
     def _reorderList(self, lst):
         """
@@ -1693,7 +2755,8 @@ class ParameterVariableSelectEditor(ParameterCommandSelectEditor):
         if self.edit.itemData(index) >= 0:
             return
 
-        parampanel = parameterPanel(self)
+        from gui.variablepanel import VariablePanel
+        parampanel = self._parameterPanel()
         astergui = parampanel.astergui()
         varpanel = VariablePanel(astergui, owner=parampanel)
         varpanel.stage = self.path().command().stage
@@ -1704,17 +2767,11 @@ class ParameterVariableSelectEditor(ParameterCommandSelectEditor):
         """
         Invoked when 'Add Variable' operation was finished.
         """
-        oldset = {}
-        for v in self.cmdlist:
-            oldset[v.uid] = 0
+        oldset = set(v.uid for v in self.cmdlist)
 
         self.changeEditContext(self.EditContext.Variables)
 
-        newvar = None
-        for i in self.cmdlist:
-            if i.uid not in oldset:
-                newvar = i
-                break
+        newvar = next((i for i in self.cmdlist if i.uid not in oldset), None)
 
         self.setValue(newvar)
 
@@ -1722,24 +2779,25 @@ class ParameterVariableSelectEditor(ParameterCommandSelectEditor):
 class ParameterMacroEditor(ParameterLineEditor):
     """Macro editor based on line edit widget."""
 
+    reusable = False
+    regexp = QRegExp("[A-Za-z]{1}\\w{0,7}$")
+
     class Creator(ParameterEditorFactoryCreator):
         """Class for line editor creation."""
 
         # pragma pylint: disable=no-self-use
-        def createEditor(self, path, parent):
+        def isSuitable(self, path):
             """
-            Create editor.
+            Check if the creator provides an editor for given parameter.
 
             Arguments:
                 path: Parameter keyword catalog path.
-                parent (QWidget): parent widget
             """
-            editor = None
-            kw_def = path.keyword()
-            if kw_def is not None:
-                defin = kw_def.definition
+            state = False
+            defin = path.keywordDefinition()
+            if defin is not None:
                 if 'into' not in defin:
-                    typeid = get_cata_typeid(kw_def)
+                    typeid = path.keywordTypeId()
                     if typeid == IDS.simp:
                         typ_attr = defin.get('typ')
                         if typ_attr is not None and \
@@ -1747,13 +2805,19 @@ class ParameterMacroEditor(ParameterLineEditor):
                             typ_attr = [typ_attr]
                         is_macro = False
                         for i in typ_attr:
-                            if is_subclass(i,
-                                           CATA.package('DataStructure').CO):
+                            if is_datastructure(i, 'CO'):
                                 is_macro = True
                                 break
                         if is_macro:
-                            editor = ParameterMacroEditor(path, parent)
-            return editor
+                            state = True
+            return state
+
+        # pragma pylint: disable=no-self-use
+        def editorClass(self):
+            """
+            Get class of editors built by the creator.
+            """
+            return ParameterMacroEditor
 
     def __init__(self, path, parent=None):
         """
@@ -1764,11 +2828,11 @@ class ParameterMacroEditor(ParameterLineEditor):
         """
         super(ParameterMacroEditor, self).__init__(path, parent)
 
-        validator = QRegExpValidator(QRegExp("[A-Za-z]{1}\\w{0,7}$"))
+        validator = QRegExpValidator(self.regexp, self)
         self.edit.setValidator(validator)
 
-    # pragma pylint: disable=no-self-use
-    def icon(self):
+    @classmethod
+    def icon(cls):
         """
         Get icon associated with the editor.
 
@@ -1780,7 +2844,8 @@ class ParameterMacroEditor(ParameterLineEditor):
         """
         return "as_ico_macro.png"
 
-    def description(self):
+    @classmethod
+    def description(cls):
         """
         Get description associated with the editor.
 
@@ -1810,11 +2875,28 @@ class ParameterMacroEditor(ParameterLineEditor):
         Arguments:
             value (int, float or str): Parameter's value.
         """
-        if value is not None and \
-                not isinstance(value, CO):
+        if not self.accepts(value):
             raise ValueError("Not supported value type")
         txt = value.name if value is not None else ""
-        self.edit.setText(txt)
+        if self.edit.text() != txt:
+            self.flush(False)
+            blocked = self.edit.blockSignals(True)
+            self.edit.setText(txt)
+            self.edit.blockSignals(blocked)
+            self.valueChanged.emit()
+
+    @classmethod
+    def accepts(cls, value):
+        """
+        Check if the editor can show given value.
+
+        Arguments:
+            value (any): Parameter's value.
+
+        Returns:
+            bool: *True* if value is supported; *False* otherwise.
+        """
+        return value is None or isinstance(value, CO)
 
 
 class ParameterSequenceEditor(ParameterEditor):
@@ -1824,19 +2906,39 @@ class ParameterSequenceEditor(ParameterEditor):
         """Class for sequence editor creation."""
 
         # pragma pylint: disable=no-self-use
-        def createEditor(self, path, parent):
+        def isSuitable(self, path):
             """
-            Create editor.
+            Check if the creator provides an editor for given parameter.
 
             Arguments:
                 path: Parameter keyword catalog path.
-                parent (QWidget): parent widget
             """
-            editor = None
+            state = False
             if not behavior().external_list and \
                     path.isKeywordSequence() and not path.isInSequence():
-                editor = ParameterSequenceEditor(path, parent)
-            return editor
+                state = True
+            return state
+
+        # pragma pylint: disable=no-self-use
+        def editorClass(self):
+            """
+            Get class of editors built by the creator.
+            """
+            return ParameterSequenceEditor
+
+    class InfoLabel(QLabel):
+        """Label which notifies about mouse press"""
+
+        clicked = pyqtSignal()
+        """Signal: emitted when label is pressed by mouse."""
+
+        def mousePressEvent(self, event):
+            """Reimplemented for internal reasons"""
+            event.accept()
+            self.clicked.emit()
+
+    gotoParameter = pyqtSignal(ParameterPath, str)
+    """Signal: emitted when sub-editor of sequence item is activated."""
 
     def __init__(self, path, parent=None):
         """
@@ -1847,16 +2949,15 @@ class ParameterSequenceEditor(ParameterEditor):
             parent (Optional[QWidget]): Parent widget.
         """
         super(ParameterSequenceEditor, self).__init__(path, parent)
+        self._units = None
+        self._info_num = None
 
         base = QHBoxLayout(self)
         base.setContentsMargins(0, 0, 0, 0)
 
-        main = QFrame(self)
-        main.setFrameStyle(QFrame.Panel | QFrame.Raised)
+        main = EditorFrame(self)
         base.addWidget(main)
-
-        layout = QHBoxLayout(main)
-        layout.setContentsMargins(0, 0, 0, 0)
+        layout = main.layout()
 
         tbar = QToolBar(main)
         tbar.setToolButtonStyle(Qt.ToolButtonIconOnly)
@@ -1866,12 +2967,12 @@ class ParameterSequenceEditor(ParameterEditor):
         self._expand.setObjectName(path.name() + "_expand")
         self._expand.setArrowType(Qt.RightArrow)
 
-        self._info = QLabel(tbar)
+        self._info = ParameterSequenceEditor.InfoLabel(tbar)
         self._info.setObjectName(path.name() + "_info")
         self._info.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Maximum)
 
         self._add = QToolButton(tbar)
-        self._add.setIcon(load_icon("as_pic_add_row.png", size=16))
+        self._add.setIcon(editor_icon("as_pic_add_row.png", 16))
         self._add.setObjectName(path.name() + "_add")
 
         tbar.addWidget(self._expand)
@@ -1888,27 +2989,39 @@ class ParameterSequenceEditor(ParameterEditor):
 
         self._add.clicked.connect(self._addClicked)
         self._expand.clicked.connect(self._expandClicked)
+        self._info.clicked.connect(self._expand.click)
 
-        from . views import ParameterView
-        self._panel = ParameterView(parameterPanel(self),
-                                    item_path=path, parent_item=None,
-                                    parent=parent)
-        self._panel.setFrameStyle(QFrame.Box | QFrame.Sunken)
-#        self._panel.setFrameStyle(QFrame.Panel | QFrame.Plain)
-
-        self._panel.appendEnabled.connect(self._add.setEnabled)
-        self._panel.checkConstraints.connect(self._updatePanelState)
+        # panel state updates requested in a row are done once
+        self._state_timer = QTimer(self)
+        self._state_timer.setInterval(0)
+        self._state_timer.setSingleShot(True)
+        self._state_timer.timeout.connect(self._updatePanelState)
 
-        self._info.installEventFilter(self)
+        # sequence panel is created when first item is added into it
+        self._panel = None
+        self._frame = QWidget(parent)
+        frame_layout = QHBoxLayout(self._frame)
+        frame_layout.setContentsMargins(0, 0, 0, 0)
+        self._frame.hide()
 
         self._updatePanelState()
 
+    def sequenceFrame(self):
+        """
+        Gets the widget which holds sequence panel
+
+        Returns:
+            (QWidget): Sequence panel container
+        """
+        return self._frame
+
     def sequencePanel(self):
         """
         Gets the sequence panel widget
 
         Returns:
-            (QWidget): Panel with sequence items
+            (QWidget): Panel with sequence items; *None* if the panel is
+            not created yet
         """
         return self._panel
 
@@ -1918,12 +3031,35 @@ class ParameterSequenceEditor(ParameterEditor):
         """
         return self._panel.itemValue() if self._panel is not None else None
 
+    def flush(self, notify=True):
+        """
+        Finish delayed value change notification of sequence items'
+        editors.
+
+        Arguments:
+            notify (Optional[bool]): If *False*, notification is
+                dropped. Defaults to *True*.
+        """
+        if self._panel is None:
+            return
+        for item in self._panel.childItems(all=True):
+            editor = getattr(item, 'editor', None)
+            if editor is not None:
+                editor.flush(notify)
+
     def setValue(self, value):
         """
         Set the value into editor.
         """
+        if self._panel is None and value is not None and value != ():
+            self._createPanel()
         if self._panel is not None:
-            self._panel.setItemValue(value)
+            # items are recreated: repaint panel once all are set
+            self._frame.setUpdatesEnabled(False)
+            try:
+                self._panel.setItemValue(value)
+            finally:
+                self._frame.setUpdatesEnabled(True)
 
     def expand(self):
         """
@@ -1950,18 +3086,18 @@ class ParameterSequenceEditor(ParameterEditor):
         """
         Expand or collaps the panel
         """
-        self._expand.setArrowType(Qt.DownArrow if expand else Qt.RightArrow)
+        arrow = Qt.DownArrow if expand else Qt.RightArrow
+        if self._expand.arrowType() == arrow:
+            return
+        self._expand.setArrowType(arrow)
         self._updatePanelVisibility()
 
     def updateTranslations(self):
         """
         Update translations in GUI elements.
         """
-        num = len(self._panel.childItems()) if self._panel is not None else 0
-        txt = str(num) + " " + (translate("ParameterPanel", "item") \
-                                    if num == 1 else \
-                                    translate("ParameterPanel", "items"))
-        self._info.setText(txt)
+        self._units = None
+        self._updateInfo(self._itemCount())
 
     def setEnabled(self, on):
         """
@@ -1969,17 +3105,7 @@ class ParameterSequenceEditor(ParameterEditor):
         """
         super(ParameterSequenceEditor, self).setEnabled(on)
 
-        if self._panel is not None:
-            self._panel.setEnabled(on)
-
-    def eventFilter(self, obj, event):
-        """
-        Translate click from label to expand/collapse button
-        """
-        if obj == self._info and event.type() == QEvent.MouseButtonPress:
-            self._expand.click()
-            return True
-        return False
+        self._frame.setEnabled(on)
 
     def showEvent(self, event):
         """
@@ -1995,12 +3121,24 @@ class ParameterSequenceEditor(ParameterEditor):
         super(ParameterSequenceEditor, self).hideEvent(event)
         self._updatePanelVisibility()
 
-    def _updatePanelVisibility(self):
+    def _updatePanelVisibility(self, num=None):
         if self._panel is None:
             return
 
-        vis = self.isExpanded() and self.isVisibleTo(self.parentWidget()) \
-            and len(self._panel.childItems()) > 0
+        # check collapsed state first: it is the most frequent case
+        # and the cheapest one
+        vis = self.isExpanded()
+        if vis:
+            if num is None:
+                num = self._itemCount()
+            # this is what isVisibleTo(parentWidget()) checks: the editor
+            # is not explicitly hidden in its parent
+            vis = num > 0 and not self.isHidden()
+        # show/hide events come in cascades from parent widgets: do not
+        # show or hide the panel again if its state does not change
+        if self._frame.isHidden() != vis and self._panel.isHidden() != vis:
+            return
+        self._frame.setVisible(vis)
         self._panel.setVisible(vis)
 
     def _expandClicked(self):
@@ -2013,24 +3151,89 @@ class ParameterSequenceEditor(ParameterEditor):
         """
         Invoked when 'Add' button is clicked.
         """
-        if self._panel is not None:
-            self._panel.createItem()
+        if self._panel is None:
+            self._createPanel()
+        self._panel.createItem()
+        if self.isExpanded():
+            self._updatePanelVisibility()
+        else:
             self.expand()
 
+    def _createPanel(self):
+        """
+        Create sequence panel.
+        """
+        from . views import ParameterView
+        self._panel = ParameterView(self._parameterPanel(),
+                                    item_path=self.path(), parent_item=None,
+                                    parent=self._frame)
+        self._panel.setFrameStyle(QFrame.Box | QFrame.Sunken)
+#        self._panel.setFrameStyle(QFrame.Panel | QFrame.Plain)
+        self._frame.layout().addWidget(self._panel)
+
+        self._panel.appendEnabled.connect(self._add.setEnabled)
+        self._panel.checkConstraints.connect(self._schedulePanelState)
+        self._panel.gotoParameter.connect(self.gotoParameter)
+        # edition of sequence items changes value of the editor
+        self._panel.contentChanged.connect(self.valueChanged)
+
+    def _itemCount(self):
+        """
+        Get number of items in the sequence panel.
+
+        Returns:
+            int: Number of items; 0 if the panel is not created yet.
+        """
+        return len(self._panel.childItems()) if self._panel is not None else 0
+
+    def _updateInfo(self, num):
+        """
+        Update label with number of items.
+
+        Arguments:
+            num (int): Number of items.
+        """
+        if self._units is None:
+            self._units = (translate("ParameterPanel", "item"),
+                           translate("ParameterPanel", "items"))
+        elif num == self._info_num:
+            return
+        self._info_num = num
+        unit = self._units[0] if num == 1 else self._units[1]
+        self._info.setText("{0} {1}".format(num, unit))
+
+    def _schedulePanelState(self):
+        """
+        Schedule update of panel state on next event loop iteration.
+        """
+        self._state_timer.start()
+
     def _updatePanelState(self):
-        self.updateTranslations()
-        self._updatePanelVisibility()
-        empty = self._panel is None or len(self._panel.childItems()) == 0
-        self._expand.setEnabled(not empty)
+        self._state_timer.stop()
+        num = self._itemCount()
+        self._updateInfo(num)
+        self._updatePanelVisibility(num)
+        self._expand.setEnabled(num > 0)
 
 
 class ParameterSubEditor(ParameterEditor):
     """`FACT` parameter's editor."""
 
-    class ListCreator(ParameterEditorFactoryCreator):
-        """Class for list editor creation."""
+    reusable = True
+
+    class Creator(ParameterEditorFactoryCreator):
+        """Base class for sub-editor creation."""
+
+        link = None
+        """Kind of sub-panel opened by the editors (see `EditorLink`)."""
 
         # pragma pylint: disable=no-self-use
+        def editorClass(self):
+            """
+            Get class of editors built by the creator.
+            """
+            return ParameterSubEditor
+
         def createEditor(self, path, parent):
             """
             Create editor.
@@ -2039,65 +3242,93 @@ class ParameterSubEditor(ParameterEditor):
                 path: Parameter keyword catalog path.
                 parent (QWidget): parent widget
             """
-            editor = None
+            return self.editorClass()(self.link, path, parent) \
+                if self.isSuitable(path) else None
+
+        def poolKey(self, path):
+            """
+            Get key of released editors which can be reused for given
+            parameter.
+
+            Arguments:
+                path: Parameter keyword catalog path.
+
+            Returns:
+                tuple: Key in the pool of released editors.
+            """
+            return (self.editorClass(), id(path.keyword()), self.link)
+
+    class ListCreator(Creator):
+        """Class for list editor creation."""
+
+        link = EditorLink.List
+
+        # pragma pylint: disable=no-self-use
+        def isSuitable(self, path):
+            """
+            Check if the creator provides an editor for given parameter.
+
+            Arguments:
+                path: Parameter keyword catalog path.
+            """
+            state = False
             if path.isKeywordSequence() and not path.isInSequence():
-                editor = ParameterSubEditor(EditorLink.List, path, parent)
-            return editor
+                state = True
+            return state
 
-    class FactCreator(ParameterEditorFactoryCreator):
+    class FactCreator(Creator):
         """Class for factor editor creation."""
 
+        link = EditorLink.Fact
+
         # pragma pylint: disable=no-self-use
-        def createEditor(self, path, parent):
+        def isSuitable(self, path):
             """
-            Create editor.
+            Check if the creator provides an editor for given parameter.
 
             Arguments:
                 path: Parameter keyword catalog path.
-                parent (QWidget): parent widget
             """
-            editor = None
-            kw_def = path.keyword()
-            if kw_def is not None:
-                if get_cata_typeid(kw_def) == IDS.fact:
-                    editor = ParameterSubEditor(EditorLink.Fact,
-                                                path, parent)
-            return editor
+            state = False
+            if path.keywordTypeId() == IDS.fact:
+                state = True
+            return state
 
-    class TableCreator(ParameterEditorFactoryCreator):
+    class TableCreator(Creator):
         """Class for table editor creation."""
 
+        link = EditorLink.Table
+
         # pragma pylint: disable=no-self-use
-        def createEditor(self, path, parent):
+        def isSuitable(self, path):
             """
-            Create editor.
+            Check if the creator provides an editor for given parameter.
 
             Arguments:
                 path: Parameter keyword catalog path.
-                parent (QWidget): parent widget
             """
-            editor = None
+            state = False
             if path.keywordType() == KeywordType.Function:
-                editor = ParameterSubEditor(EditorLink.Table, path, parent)
-            return editor
+                state = True
+            return state
 
-
-    class MeshGroupCreator(ParameterEditorFactoryCreator):
+    class MeshGroupCreator(Creator):
         """Class for list editor creation."""
 
+        link = EditorLink.GrMa
+
         # pragma pylint: disable=no-self-use
-        def createEditor(self, path, parent):
+        def isSuitable(self, path):
             """
-            Create editor.
+            Check if the creator provides an editor for given parameter.
 
             Arguments:
                 path: Parameter keyword catalog path.
-                parent (QWidget): parent widget
             """
-            editor = None
+            state = False
             if path.keywordType() == KeywordType.MeshGroup:
-                editor = ParameterSubEditor(EditorLink.GrMa, path, parent)
-            return editor
+                state = True
+            return state
 
     def __init__(self, link, path, parent=None):
         """
@@ -2109,23 +3340,55 @@ class ParameterSubEditor(ParameterEditor):
         super(ParameterSubEditor, self).__init__(path, parent)
         self.link = link
         self.storage = None
+        # button is created when editor is shown for the first time
+        self.edit = None
 
-        base = QHBoxLayout(self)
-        base.setContentsMargins(0, 0, 0, 0)
+    def setVisible(self, visible):
+        """
+        Reimplemented for internal reasons
+        """
+        if visible:
+            self._createButton()
+        super(ParameterSubEditor, self).setVisible(visible)
 
-        main = QFrame(self)
-        main.setFrameStyle(QFrame.Panel | QFrame.Raised)
-        base.addWidget(main)
+    def reuse(self, path, parent):
+        """
+        Attach released editor to the parameter.
 
-        layout = QHBoxLayout(main)
-        layout.setContentsMargins(0, 0, 0, 0)
+        Arguments:
+            path (ParameterPath): Parameter path.
+            parent (QWidget): Parent widget.
+        """
+        button = self.edit
+        super(ParameterSubEditor, self).reuse(path, parent)
+        # button created before release shows contents of previous path;
+        # new button (see `setVisible()`) is built for actual one
+        if button is not None:
+            button.setPath(path)
+            button.setObjectName(self.name())
 
-        txt = translate("ParameterPanel", "Edit...")
-        self.edit = ParameterButton(path, txt, main)
-        self.edit.setObjectName(self.name())
-        self.edit.clicked.connect(self._editClicked)
+    def poolKey(self):
+        """
+        Get key of the editor in the pool of released editors.
 
-        layout.addWidget(self.edit)
+        Returns:
+            tuple: Key in the pool of released editors.
+        """
+        return (type(self), id(self.keyword()), self.link)
+
+    @classmethod
+    def editText(cls):
+        """
+        Get text of the 'Edit' button.
+
+        Text is translated once and shared by all sub-editors.
+
+        Returns:
+            str: Button text.
+        """
+        if not hasattr(cls, "_edit_text"):
+            cls._edit_text = translate("ParameterPanel", "Edit...")
+        return cls._edit_text
 
     def value(self):
         """
@@ -2144,12 +3407,35 @@ class ParameterSubEditor(ParameterEditor):
         """
         Update translations.
         """
-        value = self.value()
-        extlist = behavior().external_list
-        mode = behavior().content_mode
-        if not self.path().isInSequence() or extlist:
-            value = None
-        self.edit.setContents(value, mode)
+        if self.edit is None:
+            return
+        props = behavior()
+        value = None
+        if self.path().isInSequence() and not props.external_list:
+            value = self.value()
+        self.edit.setContents(value, props.content_mode)
+
+    def _createButton(self):
+        """
+        Create 'Edit' button if it is not created yet.
+        """
+        if self.edit is not None:
+            return
+
+        base = QHBoxLayout(self)
+        base.setContentsMargins(0, 0, 0, 0)
+
+        main = EditorFrame(self)
+        base.addWidget(main)
+        layout = main.layout()
+
+        self.edit = ParameterButton(self.path(), self.editText(), main)
+        self.edit.setObjectName(self.name())
+        self.edit.clicked.connect(self._editClicked)
+
+        layout.addWidget(self.edit)
+
+        self.updateTranslations()
 
     def _editClicked(self):
         """
@@ -2161,10 +3447,31 @@ class ParameterSubEditor(ParameterEditor):
 class ParameterMeshGroupSelectionEditor(ParameterSubEditor):
     """Mesh group selection parameter's editor."""
 
+    reusable = False
+
     class Creator(ParameterEditorFactoryCreator):
         """Class for list editor creation."""
 
         # pragma pylint: disable=no-self-use
+        def isSuitable(self, path):
+            """
+            Check if the creator provides an editor for given parameter.
+
+            Arguments:
+                path: Parameter keyword catalog path.
+            """
+            state = False
+            if path.keywordType() == KeywordType.MeshGroup:
+                state = True
+            return state
+
+        # pragma pylint: disable=no-self-use
+        def editorClass(self):
+            """
+            Get class of editors built by the creator.
+            """
+            return ParameterMeshGroupSelectionEditor
+
         def createEditor(self, path, parent):
             """
             Create editor.
@@ -2173,11 +3480,9 @@ class ParameterMeshGroupSelectionEditor(ParameterSubEditor):
                 path: Parameter keyword catalog path.
                 parent (QWidget): parent widget
             """
-            editor = None
-            if path.keywordType() == KeywordType.MeshGroup:
-                editor = ParameterMeshGroupSelectionEditor(EditorLink.GrMa,
-                                                           path, parent)
-            return editor
+            return ParameterMeshGroupSelectionEditor(EditorLink.GrMa,
+                                                     path, parent) \
+                if self.isSuitable(path) else None
 
     def __init__(self, link, path, parent=None):
         """
@@ -2193,29 +3498,33 @@ class ParameterMeshGroupSelectionEditor(ParameterSubEditor):
         """
         Update translations.
         """
-        extlist = behavior().external_list
-        value = self.value() if not extlist else None
-        mode = behavior().content_mode
-        self.edit.setContents(value, mode)
+        if self.edit is None:
+            return
+        props = behavior()
+        value = self.value() if not props.external_list else None
+        self.edit.setContents(value, props.content_mode)
 
 
 class ParameterMeshSelectionEditor(ParameterLineEditor):
     """Mesh group selection based on line edit widget."""
 
+    reusable = False
+
     class Creator(ParameterEditorFactoryCreator):
         """Class for factor editor creation."""
 
         # pragma pylint: disable=no-self-use
-        def createEditor(self, path, parent):
+        def isSuitable(self, path):
             """
-            Create editor.
+            Check if the creator provides an editor for given parameter.
 
             Arguments:
                 path: Parameter keyword catalog path.
-                parent (QWidget): parent widget
             """
-            editor = None
-            kw_def = path.keyword().definition
+            kw_def = path.keywordDefinition()
+            if kw_def is None:
+                return False
+            state = False
             typ = kw_def.get('typ')
             if isinstance(typ, (tuple, list)):
                 if len(typ) > 0:
@@ -2224,9 +3533,16 @@ class ParameterMeshSelectionEditor(ParameterLineEditor):
                     typ = typ[0]
                 else:
                     typ = None
-            if is_subclass(typ, CATA.package('DataStructure').GEOM):
-                editor = ParameterMeshSelectionEditor(path, parent)
-            return editor
+            if is_datastructure(typ, 'GEOM'):
+                state = True
+            return state
+
+        # pragma pylint: disable=no-self-use
+        def editorClass(self):
+            """
+            Get class of editors built by the creator.
+            """
+            return ParameterMeshSelectionEditor
 
     def __init__(self, path, parent=None):
         """
@@ -29,16 +29,17 @@ from PyQt5.Qt import (Qt, QRadioButton, QLabel, QRect, QToolButton, QObject,
                       QCheckBox, QMouseEvent, QEvent, QTimer, QApplication,
                       QSpacerItem, QFrame, pyqtSignal)
 
-from common import is_child, load_icon, translate, bold, italic
+from common import disconnect, is_child, translate, bold, italic
 
-from datamodel import IDS, KeysMixing, get_cata_typeid
+from datamodel import IDS, KeysMixing
 from datamodel.command import Variable
 
 from gui import translate_rule
 from gui.behavior import behavior
 
 from .basic import KeywordType
-from .editors import parameter_editor_factory
+from .editors import (ParameterEditor, editor_icon,
+                      parameter_editor_factory)
 from .widgets import ParameterLabel, SpinWidget
 from .path import ParameterPath
 
@@ -85,18 +86,27 @@ class ParameterItem(object):
 
         self._path = item_path
 
+        # leaf items keep shared empty tuples until something is added
         self._flags = 0
-        self._rules = []
+        self._rules = ()
+        self._attached_rules = None
         self._timer = None
+        self._pending_items = None
+        self._value_batch = 0
+        self._changed_items = None
+        self._notified_items = None
         self.storage = None
 
         self._slave = None
         self._master = None
 
-        self._depend_items = []
+        self._depend_items = ()
 
         self._parent_item = None
-        self._child_items = []
+        self._root_item = self
+        self._child_items = ()
+        self._child_set = ()
+        self._context_cache = {}
         self.setParentItem(parent_item)
 
     def flags(self):
@@ -115,14 +125,11 @@ class ParameterItem(object):
         Arguments:
             flags (int): Combination of setted flags
         """
-        if self._flags != flags:
-            aflags = flags & ~self._flags
-            dflags = self._flags & ~flags
+        changed = self._flags ^ flags
+        if changed != 0:
             self._flags = flags
-            if aflags != 0:
-                self.flagsChanged(aflags)
-            if dflags != 0:
-                self.flagsChanged(dflags)
+            self.invalidateContext()
+            self.flagsChanged(changed)
 
     def testFlags(self, flags):
         """
@@ -152,6 +159,9 @@ class ParameterItem(object):
     def flagsChanged(self, flags):
         """
         Invoked when item flags was changed
+
+        Arguments:
+            flags (int): Combination of set and reset flags
         """
         pass
 
@@ -200,6 +210,15 @@ class ParameterItem(object):
         if self._timer is not None:
             self._timer.deleteLater()
             self._timer = None
+            self._pending_items = None
+        self._changed_items = None
+
+    def releaseEditors(self):
+        """
+        Give editors of the item and its children back to the factory.
+        """
+        for item in self.childItems():
+            item.releaseEditors()
 
     def grid(self):
         """
@@ -246,10 +265,7 @@ class ParameterItem(object):
         Returns:
             ParameterItem: Root item.
         """
-        item = self
-        while item.parentItem() is not None:
-            item = item.parentItem()
-        return item
+        return self._root_item
 
     def parentItem(self):
         """
@@ -271,9 +287,25 @@ class ParameterItem(object):
             if self._parent_item is not None:
                 self._parent_item.removeChildItem(self)
             self._parent_item = parent_item
+            self._attached_rules = None
+            self._setRootItem(parent_item.rootItem()
+                              if parent_item is not None else self)
             if self._parent_item is not None:
                 self._parent_item.appendChildItem(self)
 
+    def _setRootItem(self, root):
+        """
+        Set root item of this item and of all its children.
+
+        Arguments:
+            root (ParameterItem): Root item.
+        """
+        stack = [self]
+        while stack:
+            item = stack.pop()
+            item._root_item = root
+            stack.extend(item._child_items)
+
     def childItems(self, **kwargs):
         """
         Get child items.
@@ -284,9 +316,12 @@ class ParameterItem(object):
         items = []
         rec = kwargs.get("all")
         if rec is not None and rec:
-            for item in self._child_items:
+            # iterative pre-order traversal
+            stack = self._child_items[::-1]
+            while stack:
+                item = stack.pop()
                 items.append(item)
-                items = items + item.childItems(**kwargs)
+                stack.extend(reversed(item._child_items))
         else:
             items = self._child_items
         return items
@@ -298,9 +333,14 @@ class ParameterItem(object):
         Arguments:
             child (ParameterItem): Child item.
         """
-        if not self._child_items.__contains__(child):
+        if child not in self._child_set:
+            if not self._child_items:
+                self._child_items = []
+                self._child_set = set()
             self._child_items.append(child)
+            self._child_set.add(child)
             child.setParentItem(self)
+            self.invalidateContext()
 
     def removeChildItem(self, child):
         """
@@ -309,9 +349,11 @@ class ParameterItem(object):
         Arguments:
             child (ParameterItem): Child item.
         """
-        if child in self._child_items:
+        if child in self._child_set:
             self._child_items.remove(child)
+            self._child_set.discard(child)
             child.setParentItem(None)
+            self.invalidateContext()
 
     def moveChildItem(self, child, offset):
         """
@@ -321,12 +363,13 @@ class ParameterItem(object):
             child (ParameterItem): Child item.
             offset (int): Child item position offset.
         """
-        if child in self._child_items:
+        if child in self._child_set:
             curpos = self._child_items.index(child)
             newpos = min(max(curpos + offset, 0), len(self._child_items) - 1)
             if newpos != curpos:
                 self._child_items.remove(child)
                 self._child_items.insert(newpos, child)
+                self.invalidateContext()
 
     def dependChanged(self, item):
         """
@@ -355,7 +398,9 @@ class ParameterItem(object):
         Arguments:
             item (ParameterItem): Dependant item.
         """
-        if not self._depend_items.__contains__(item):
+        if item not in self._depend_items:
+            if not self._depend_items:
+                self._depend_items = []
             self._depend_items.append(item)
 
     def removeDependItem(self, item):
@@ -365,7 +410,7 @@ class ParameterItem(object):
         Arguments:
             item (ParameterItem): Dependant item.
         """
-        if self._depend_items.__contains__(item):
+        if item in self._depend_items:
             self._depend_items.remove(item)
 
     def appendTo(self):
@@ -393,15 +438,7 @@ class ParameterItem(object):
         Method should be implemented in sub-classes.
         Default implementation does nothing.
         """
-        tbl = self.grid()
-        last = -1
-        for row in xrange(tbl.rowCount() - 1, -1, -1):
-            for col in xrange(tbl.columnCount()):
-                if tbl.itemAtPosition(row, col) is not None:
-                    last = row
-                    break
-            if last != -1:
-                break
+        pass
 
     def itemRect(self):
         """
@@ -447,7 +484,7 @@ class ParameterItem(object):
         Returns:
            IDS: catalog type identifier
         """
-        return get_cata_typeid(self.keyword())
+        return self.itemPath().keywordTypeId()
 
     def isItemList(self):
         """
@@ -476,19 +513,17 @@ class ParameterItem(object):
         if sub_path.startswith(ParameterPath.separator):
             my_path = self.itemPath().path() + ParameterPath.separator
             if sub_path.startswith(my_path):
-                sub_path = sub_path[len(my_path):len(sub_path)]
+                sub_path = sub_path[len(my_path):]
             else:
                 sub_path = ""
 
         if len(sub_path) > 0:
-            sub_list = sub_path.split(ParameterPath.separator)
-            found_item = self.findItemByName(sub_list.pop(0))
-            if found_item is not None:
-                if len(sub_list) > 0:
-                    res_item = found_item.findItemByPath(\
-                        ParameterPath.separator.join(sub_list))
-                else:
-                    res_item = found_item
+            # split once and go down level by level
+            res_item = self
+            for name in sub_path.split(ParameterPath.separator):
+                res_item = res_item.findItemByName(name)
+                if res_item is None:
+                    break
 
         return res_item
 
@@ -523,7 +558,7 @@ class ParameterItem(object):
         for item in self.childItems():
             if item.itemName() == name:
                 res_list.append(item)
-            res_list = res_list + item.findItemsByName(name)
+            res_list.extend(item.findItemsByName(name))
         return res_list
 
     # pragma pylint: disable=no-self-use
@@ -595,15 +630,46 @@ class ParameterItem(object):
             dict: Dictionary with all child item values.
         """
         item = self.rootItem()
-        context = item.itemValue(default=with_default)
+        context = item.contextValue(with_default)
         while item.masterItem() is not None:
             item = item.masterItem().rootItem()
-            topctx = item.itemValue(default=with_default)
+            topctx = item.contextValue(with_default)
             if isinstance(topctx, dict):
                 if isinstance(context, dict):
+                    topctx = dict(topctx)
                     topctx.update(context)
                 context = topctx
-        return context
+        return dict(context) if isinstance(context, dict) else context
+
+    def contextValue(self, with_default=False):
+        """
+        Get item's value to be used as a condition context.
+
+        The value is computed once and kept until the item tree
+        is modified (see `invalidateContext()`).
+
+        Arguments:
+            with_default (bool): Take into account default values.
+
+        Returns:
+            dict: Dictionary with all child item values.
+        """
+        # pending changes invalidate the cached value
+        ParameterEditor.flushPending()
+        self.flushValueChanges()
+        if with_default not in self._context_cache:
+            self._context_cache[with_default] = \
+                self.itemValue(default=with_default)
+        return self._context_cache[with_default]
+
+    def invalidateContext(self):
+        """
+        Mark values cached by the item and its parents as outdated.
+        """
+        item = self
+        while item is not None:
+            item._context_cache.clear()
+            item = item.parentItem()
 
     def itemValue(self, **kwargs):
         """
@@ -616,27 +682,28 @@ class ParameterItem(object):
                     name (str): value (any)
                 }
         """
-        glob = kwargs['glob'] if 'glob' in kwargs else False
-        default = kwargs['default'] if 'default' in kwargs else False
+        glob = kwargs.get('glob', False)
+        default = kwargs.get('default', False)
         childvalue = self.storage
-        typeid = self.cataTypeId()
-        if typeid in (IDS.fact, IDS.bloc, IDS.command) \
-                and len(self.childItems()) > 0:
+        children = self.childItems()
+        if len(children) > 0 and \
+                self.cataTypeId() in (IDS.fact, IDS.bloc, IDS.command):
             childvalue = {}
-            for item in self.childItems():
-                if item.isUsed() or (default and item.hasDefaultValue()):
-                    if item.isUsed():
-                        val = item.slaveItem().itemValue(**kwargs) \
-                            if glob and item.slaveItem() is not None else \
-                            item.itemValue(**kwargs)
-                    elif not self.testFlags(self.ItemFlags.Excluded):
-                        val = item.defaultValue()
-                    if val is not None and item.cataTypeId() == IDS.bloc \
-                            and isinstance(val, dict):
-                        for key, value in val.iteritems():
-                            childvalue[key] = value
-                    else:
-                        childvalue[item.itemName()] = val
+            excluded = self.testFlags(self.ItemFlags.Excluded)
+            for item in children:
+                if item.isUsed():
+                    slave = item.slaveItem() if glob else None
+                    val = slave.itemValue(**kwargs) if slave is not None \
+                        else item.itemValue(**kwargs)
+                elif default and not excluded and item.hasDefaultValue():
+                    val = item.defaultValue()
+                else:
+                    continue
+                if val is not None and item.cataTypeId() == IDS.bloc \
+                        and isinstance(val, dict):
+                    childvalue.update(val)
+                else:
+                    childvalue[item.itemName()] = val
         self.storage = childvalue
         return childvalue
 
@@ -684,11 +751,7 @@ class ParameterItem(object):
         Returns:
             True if the parameter is mandatory; False otherwise.
         """
-        res = False
-        param_def = self.keyword()
-        if param_def is not None:
-            res = param_def.isMandatory()
-        return res
+        return self.itemPath().isKeywordMandatory()
 
     def hasDefaultValue(self):
         """
@@ -717,8 +780,9 @@ class ParameterItem(object):
         """
         rulelist = self._rules
         if rec:
+            rulelist = list(rulelist)
             for item in self.childItems():
-                rulelist = rulelist + item.itemRules(rec)
+                rulelist.extend(item.itemRules(rec))
         return rulelist
 
     def attachedItemRules(self):
@@ -728,14 +792,15 @@ class ParameterItem(object):
         Returns:
             list: List of ParameterRuleItem objects
         """
-        ruleslist = []
-        if self.parentItem() is not None:
-            ruleslist = self.parentItem().itemRules()
-        reslist = []
-        for rule in ruleslist:
-            if rule.containsItem(self):
-                reslist.append(rule)
-        return reslist
+        # parent's rules are created once, result is kept until
+        # the item is moved to another parent
+        if self._attached_rules is None:
+            ruleslist = []
+            if self.parentItem() is not None:
+                ruleslist = self.parentItem().itemRules()
+            self._attached_rules = [rule for rule in ruleslist
+                                    if rule.containsItem(self)]
+        return self._attached_rules
 
     def attachedItemRuleNames(self):
         """
@@ -745,13 +810,12 @@ class ParameterItem(object):
             list: List of unique strings with attached rule names
         """
         nameslist = []
-        ruleslist = self.attachedItemRules()
-        uniq = {}
-        for rule in ruleslist:
+        uniq = set()
+        for rule in self.attachedItemRules():
             rulename = rule.itemName()
             if rulename not in uniq:
                 nameslist.append(rulename)
-                uniq[rulename] = 0
+                uniq.add(rulename)
         return nameslist
 
     # pragma pylint: disable=no-self-use
@@ -771,19 +835,14 @@ class ParameterItem(object):
     def updateItem(self, force=False):
         """
         Schedule item's components state update.
+
+        Updates are postponed with a single timer owned by the root item.
         """
         if force:
             self._updateItem()
         else:
-            if self._timer is None:
-                self._timer = QTimer()
-                self._timer.setInterval(0)
-                self._timer.setSingleShot(True)
-                self._timer.timeout.connect(self._onUpdateTimeout)
-
-            if self._timer.isActive():
-                self._timer.stop()
-            self._timer.start()
+            root = self._startUpdateTimer()
+            root._pending_items.add(self)
 
     def updateCondition(self):
         """
@@ -797,11 +856,14 @@ class ParameterItem(object):
         """
         Perform child items updation according to the condition.
         """
-        for item in self.childItems():
-            item.updateCondition()
-
-        for i in self.childItems():
-            i.updateConditions()
+        # iterative traversal: conditions of all children of an item
+        # are updated before going down to their own children
+        stack = [self]
+        while stack:
+            children = stack.pop().childItems()
+            for item in children:
+                item.updateCondition()
+            stack.extend(reversed(children))
 
     def updateRules(self, item):
         """
@@ -812,18 +874,80 @@ class ParameterItem(object):
             if rule.containsItem(item):
                 rule.stateChanged(item)
 
-        for item in self.childItems():
-            item.updateRules(item)
-
     def valueChanged(self):
         """
         Called when item's value is changed.
+
+        While value changes are collected by the root item (see
+        `setItemValue()`), dependant and parent items are notified
+        later by `flushValueChanges()`.
         """
+        self.invalidateContext()
+        root = self.rootItem()
+        if root._value_batch:
+            notified = root._notified_items
+            if notified is None or self not in notified:
+                if root._changed_items is None:
+                    root._changed_items = set()
+                root._changed_items.add(self)
+            return
         for item in self.dependItems():
             item.dependChanged(self)
         if self.parentItem() is not None:
             self.parentItem().valueChanged()
 
+    def flushValueChanges(self):
+        """
+        Notify dependant and parent items about collected value changes.
+
+        Each dependant item is notified once per changed item; each
+        parent item is notified once, after its child items.
+        Does nothing while value changes are being collected.
+        """
+        root = self.rootItem()
+        if root._value_batch or not root._changed_items:
+            return
+        root._value_batch += 1
+        root._notified_items = set()
+        try:
+            while root._changed_items:
+                items = [item for item in root._changed_items
+                         if item.rootItem() is root]
+                root._changed_items = set()
+                root._notified_items.update(items)
+                depends = set()
+                for item in items:
+                    for dep in item.dependItems():
+                        depends.add((dep, item))
+                # depth of each parent which is not notified yet
+                levels = {}
+                for item in items:
+                    chain = []
+                    parent = item.parentItem()
+                    while parent is not None and \
+                            parent not in root._notified_items:
+                        root._notified_items.add(parent)
+                        chain.append(parent)
+                        parent = parent.parentItem()
+                    depth = 0
+                    while parent is not None:
+                        depth += 1
+                        parent = parent.parentItem()
+                    for parent in reversed(chain):
+                        levels[parent] = depth
+                        depth += 1
+                for dep, item in depends:
+                    dep.dependChanged(item)
+                for parent in sorted(levels, key=levels.get, reverse=True):
+                    parent.valueChanged()
+                    for dep in parent.dependItems():
+                        if (dep, parent) not in depends:
+                            depends.add((dep, parent))
+                            dep.dependChanged(parent)
+        finally:
+            root._notified_items = None
+            root._value_batch -= 1
+
     def checkChanged(self, item):
         """Called when item's check state is changed."""
         if self.parentItem() is not None:
@@ -833,21 +957,27 @@ class ParameterItem(object):
         """
         Called when item state is changed.
 
+        Only the root item handles it, so it is called directly.
+
         Arguments:
             path (ParameterPath): Parameter path.
         """
-        if self.parentItem() is not None:
-            self.parentItem().itemStateChanged(item)
+        root = self.rootItem()
+        if root is not self:
+            root.itemStateChanged(item)
 
     def parameterActivated(self, path, link=''):
         """
         Called when item's sub-editor is activated.
 
+        Only the root item handles it, so it is called directly.
+
         Arguments:
             path (ParameterPath): Parameter path.
         """
-        if self.parentItem() is not None:
-            self.parentItem().parameterActivated(path, link)
+        root = self.rootItem()
+        if root is not self:
+            root.parameterActivated(path, link)
 
     def updateTranslations(self):
         """
@@ -865,18 +995,43 @@ class ParameterItem(object):
         """
         pass
 
+    def _startUpdateTimer(self):
+        """
+        Start the update timer shared by all items of the tree.
+
+        Returns:
+            ParameterItem: Root item which owns the timer.
+        """
+        root = self.rootItem()
+        if root._timer is None:
+            root._timer = QTimer()
+            root._timer.setInterval(0)
+            root._timer.setSingleShot(True)
+            root._timer.timeout.connect(root._onUpdateTimeout)
+            root._pending_items = set()
+        if not root._timer.isActive():
+            root._timer.start()
+        return root
+
     def _onUpdateTimeout(self):
         """
         Invoked when update timer timeout activated,
         """
-        self._updateItem()
+        self.flushValueChanges()
+        items = self._pending_items
+        self._pending_items = set()
+        for item in items:
+            # skip items removed from the tree in the meantime
+            if item.rootItem() is self:
+                item._updateItem()
 
     def _updateItem(self):
         """
         Update the item components state.
         """
-        if self._timer is not None and self._timer.isActive():
-            self._timer.stop()
+        root = self.rootItem()
+        if root._timer is not None and root._timer.isActive():
+            root._pending_items.discard(self)
 
 
 class ParameterEditItem(ParameterItem):
@@ -900,6 +1055,9 @@ class ParameterEditItem(ParameterItem):
         self.mandatory = None
         self.label = None
         self.notsupp = None
+        self._cells = None
+        self._widgets_state = None
+        self._depends = None
         if not param_mandatory:
             exclusive = False
             for arule in rules:
@@ -915,9 +1073,7 @@ class ParameterEditItem(ParameterItem):
             self.check.clicked.connect(self._checkClicked)
             self.check.toggled.connect(self._checkToggled)
         self.mandatory = QLabel("*" if param_mandatory else "")
-        pal = self.mandatory.palette()
-        pal.setColor(self.mandatory.foregroundRole(), Qt.red)
-        self.mandatory.setPalette(pal)
+        self.mandatory.setPalette(self.mandatoryPalette(self.mandatory))
 
         self.label = ParameterLabel(self.itemPath(), rules)
         self.label.clicked.connect(self._labelClicked)
@@ -926,15 +1082,14 @@ class ParameterEditItem(ParameterItem):
         self.editor = factory.createEditor(self.itemPath(), tbl.parentWidget())
 
         if self.editor is None:
-            label = translate("ParameterPanel", "Not Supported")
-            self.notsupp = QLabel(italic(bold(label)), tbl.parentWidget())
+            self.notsupp = QLabel(self.notSupportedText(), tbl.parentWidget())
             self.notsupp.setFrameStyle(QFrame.Sunken|QFrame.Panel)
             self.notsupp.setAlignment(Qt.AlignCenter)
 
         self.default = None
         if self.hasDefaultValue():
             self.default = QToolButton()
-            self.default.setIcon(load_icon("as_pic_undo.png"))
+            self.default.setIcon(editor_icon("as_pic_undo.png"))
             self.default.clicked.connect(self._resetToDefault)
             self.default.setToolTip(translate("ParameterPanel",
                                               "Reset to default"))
@@ -945,6 +1100,40 @@ class ParameterEditItem(ParameterItem):
             self.editor.valueChanged.connect(self._valueChanged)
             self.editor.linkActivated.connect(self._linkActivated)
 
+    @classmethod
+    def mandatoryPalette(cls, label):
+        """
+        Get palette of the mandatory mark label.
+
+        Palette is created once and shared by all items.
+
+        Arguments:
+            label (QLabel): Mandatory mark label.
+
+        Returns:
+            QPalette: Palette with red foreground.
+        """
+        if not hasattr(cls, "_mandatory_palette"):
+            pal = label.palette()
+            pal.setColor(label.foregroundRole(), Qt.red)
+            cls._mandatory_palette = pal
+        return cls._mandatory_palette
+
+    @classmethod
+    def notSupportedText(cls):
+        """
+        Get text shown instead of editor for unsupported keyword.
+
+        Text is translated once and shared by all items.
+
+        Returns:
+            str: Label text.
+        """
+        if not hasattr(cls, "_notsupp_text"):
+            label = translate("ParameterPanel", "Not Supported")
+            cls._notsupp_text = italic(bold(label))
+        return cls._notsupp_text
+
     def cleanup(self):
         """
         Remove internal structures
@@ -960,9 +1149,7 @@ class ParameterEditItem(ParameterItem):
         if self.mandatory is not None:
             self.mandatory.deleteLater()
             self.mandatory = None
-        if self.editor is not None:
-            self.editor.deleteLater()
-            self.editor = None
+        self._releaseEditor()
         if self.default is not None:
             self.default.deleteLater()
             self.default = None
@@ -970,6 +1157,24 @@ class ParameterEditItem(ParameterItem):
             self.notsupp.deleteLater()
             self.notsupp = None
 
+    def releaseEditors(self):
+        """
+        Give editor of the item back to the factory.
+        """
+        super(ParameterEditItem, self).releaseEditors()
+        self._releaseEditor()
+
+    def _releaseEditor(self):
+        """
+        Give editor of the item (but not of its children) back
+        to the factory.
+        """
+        if self.editor is not None:
+            disconnect(self.editor.valueChanged, self._valueChanged)
+            disconnect(self.editor.linkActivated, self._linkActivated)
+            parameter_editor_factory().releaseEditor(self.editor)
+            self.editor = None
+
     def appendTo(self):
         """
         Append item to the parameter grid layout.
@@ -981,25 +1186,40 @@ class ParameterEditItem(ParameterItem):
 
         if not added:
             index = tbl.actualRowCount()
+            self._cells = {}
+            self._widgets_state = None
             if self.check is not None:
-                tbl.addWidget(self.check, index, self.ColumnId.Check)
+                self._addWidget(self.check, index, self.ColumnId.Check)
 
             if self.label is not None:
-                tbl.addWidget(self.label, index, self.ColumnId.Label)
+                self._addWidget(self.label, index, self.ColumnId.Label)
 
             if self.mandatory is not None:
-                tbl.addWidget(self.mandatory, index, self.ColumnId.Mandatory)
+                self._addWidget(self.mandatory, index,
+                                self.ColumnId.Mandatory)
 
             if self.editor is not None:
-                tbl.addWidget(self.editor, index, self.ColumnId.Editor)
+                self._addWidget(self.editor, index, self.ColumnId.Editor)
             elif self.notsupp is not None:
-                tbl.addWidget(self.notsupp, index, self.ColumnId.Editor)
+                self._addWidget(self.notsupp, index, self.ColumnId.Editor)
 
             if self.default is not None:
-                tbl.addWidget(self.default, index, self.ColumnId.Default)
+                self._addWidget(self.default, index, self.ColumnId.Default)
 
             self.updateItem()
 
+    def _addWidget(self, widget, row, column):
+        """
+        Add item's widget to the grid layout and remember its cell.
+
+        Arguments:
+            widget (QWidget): Item's widget.
+            row (int): Grid row.
+            column (int): Grid column.
+        """
+        self.grid().addWidget(widget, row, column)
+        self._cells[widget] = (row, column, 1, 1)
+
     def isAppended(self):
         """
         Item append to the parameter grid layout state.
@@ -1026,6 +1246,7 @@ class ParameterEditItem(ParameterItem):
                 tbl.removeWidget(self.notsupp)
             if self.default is not None:
                 tbl.removeWidget(self.default)
+        self._cells = None
 
         super(ParameterEditItem, self).removeFrom()
 
@@ -1039,7 +1260,16 @@ class ParameterEditItem(ParameterItem):
             item (ParameterItem): dependent item
         """
         if self.editor is not None:
-            self.editor.dependValue(item.itemPath(), item.itemValue())
+            path = item.itemPath()
+            value = item.itemValue()
+            # editor is only notified about actual changes
+            if self._depends is None:
+                self._depends = {}
+            key = path.path()
+            if key in self._depends and self._depends[key] == value:
+                return
+            self._depends[key] = value
+            self.editor.dependValue(path, value)
 
     def itemWidgets(self):
         """
@@ -1057,22 +1287,25 @@ class ParameterEditItem(ParameterItem):
         """
         tbl = self.grid()
         widgets = self.itemWidgets()
-        begrow = endrow = begcol = endcol = -1
+        cells = self._cells if self._cells is not None else {}
+        positions = []
         for wid in widgets:
             if wid is not None:
-                idx = tbl.indexOf(wid)
-                if idx >= 0:
-                    pos = tbl.getItemPosition(idx)
-                    begrow = pos[0] if begrow < 0 else min(begrow, pos[0])
-                    endrow = pos[0] + pos[2] - 1 \
-                        if endrow < 0 else max(endrow, pos[0] + pos[2] - 1)
-                    begcol = pos[1] if begcol < 0 else min(begcol, pos[1])
-                    endcol = pos[1] + pos[3] - 1 \
-                        if endcol < 0 else max(endcol, pos[1] + pos[3] - 1)
-
-        if begrow < 0 or endrow < 0 or begcol < 0 or endcol < 0:
+                pos = cells.get(wid)
+                if pos is None:
+                    idx = tbl.indexOf(wid)
+                    pos = tbl.getItemPosition(idx) if idx >= 0 else None
+                if pos is not None:
+                    positions.append(pos)
+
+        if not positions:
             return QRect()
 
+        begrow = min(pos[0] for pos in positions)
+        endrow = max(pos[0] + pos[2] - 1 for pos in positions)
+        begcol = min(pos[1] for pos in positions)
+        endcol = max(pos[1] + pos[3] - 1 for pos in positions)
+
         start = tbl.cellRect(begrow, begcol)
         finish = tbl.cellRect(endrow, endcol)
 
@@ -1119,6 +1352,7 @@ class ParameterEditItem(ParameterItem):
         """
         if self.check is not None:
             self.check.setChecked(value)
+            self.invalidateContext()
 
     def value(self):
         """
@@ -1287,8 +1521,19 @@ class ParameterEditItem(ParameterItem):
         self.parameterActivated(self.itemPath(), link)
 
     def _valueChanged(self):
-        """Called when editor value is changed."""
-        self.valueChanged()
+        """
+        Called when editor value is changed.
+
+        Dependant and parent items are notified on next event loop
+        iteration, so that changes made in a row are handled once.
+        """
+        root = self.rootItem()
+        root._value_batch += 1
+        try:
+            self.valueChanged()
+        finally:
+            root._value_batch -= 1
+        root._startUpdateTimer()
         self.updateItem()
 
     def _labelClicked(self):
@@ -1312,6 +1557,14 @@ class ParameterEditItem(ParameterItem):
                     and self.parentItem().isItemList())
         blocked = self.testFlags(self.ItemFlags.Disabled)
 
+        # everything below only depends on these values
+        modified = self.default is not None and \
+            self.defaultValue() != self.value()
+        state = (self.flags(), enabled, modified, self.hasDefaultValue())
+        if state == self._widgets_state:
+            return
+        self._widgets_state = state
+
         if self.check:
             self.check.setEnabled(not blocked)
         if self.label is not None:
@@ -1327,7 +1580,7 @@ class ParameterEditItem(ParameterItem):
                 self.isKeywordMandatory()
             self.mandatory.setText("*" if mflag else "")
         if self.default is not None:
-            self.default.setEnabled(self.defaultValue() != self.value())
+            self.default.setEnabled(modified)
 
         hidden = self.testFlags(self.ItemFlags.Filtered) or \
             self.testFlags(self.ItemFlags.Excluded) or \
@@ -1343,15 +1596,13 @@ class ParameterEditItem(ParameterItem):
 
         mode = "none"
         content = None
-        if self.cataTypeId() != IDS.simp or \
-                self.itemPath().keywordType() != KeywordType.Standard:
-            extlist = behavior().external_list
-            if extlist or \
-                    (not extlist and \
-                         (not self.itemPath().isKeywordSequence() or \
-                              self.itemPath().keywordType() != \
-                              KeywordType.Standard)):
-                mode = behavior().content_mode
+        path = self.itemPath()
+        standard = path.keywordType() == KeywordType.Standard
+        if path.keywordTypeId() != IDS.simp or not standard:
+            props = behavior()
+            if props.external_list or \
+                    not path.isKeywordSequence() or not standard:
+                mode = props.content_mode
                 if mode is not None and mode != "none":
                     content = self.itemValue()
         self.label.setContents(content, mode)
@@ -1379,7 +1630,7 @@ class ParameterListItem(ParameterEditItem):
                                        "Change item position in list"))
 
         self.remove = QToolButton()
-        self.remove.setIcon(load_icon("as_pic_delete.png"))
+        self.remove.setIcon(editor_icon("as_pic_delete.png"))
         self.remove.clicked.connect(self._remove)
         self.remove.setObjectName("Remove_Item")
         self.remove.setToolTip(translate("ParameterPanel", "Remove item"))
@@ -1409,9 +1660,9 @@ class ParameterListItem(ParameterEditItem):
             super(ParameterListItem, self).appendTo()
 
             if self.spin is not None:
-                tbl.addWidget(self.spin, index, self.ColumnId.Move)
+                self._addWidget(self.spin, index, self.ColumnId.Move)
             if self.remove is not None:
-                tbl.addWidget(self.remove, index, self.ColumnId.Remove)
+                self._addWidget(self.remove, index, self.ColumnId.Remove)
 
     def removeFrom(self):
         """
@@ -1463,11 +1714,11 @@ class ParameterListItem(ParameterEditItem):
         last = False
 
         if self.parentItem() is not None:
+            # only the ends of the list matter: no need to search it
             itemlist = self.parentItem().childItems()
-            if self in itemlist:
-                index = itemlist.index(self)
-                first = index == 0
-                last = index == (len(itemlist) - 1)
+            if len(itemlist) > 0:
+                first = itemlist[0] is self
+                last = itemlist[-1] is self
 
         if self.spin is not None:
             self.spin.setSpinEnabled(SpinWidget.SpinType.Up, not first)
@@ -1513,6 +1764,7 @@ class ParameterBlockItem(ParameterItem):
         self._createRules()
 
         param_def = self.keyword()
+        item_path = self.itemPath()
 
         if self.isItemList():
             nb_min = 0
@@ -1520,29 +1772,28 @@ class ParameterBlockItem(ParameterItem):
                 nb_min = param_def.definition['min']
 
             for i in range(nb_min):
-                ParameterListItem(item_path=self.itemPath().
-                                  absolutePath(str(i)),
+                ParameterListItem(item_path=item_path.absolutePath(str(i)),
                                   parent_item=self)
             self.itemStateChanged(self)
         else:
-            used_kws = {}
+            used_kws = set()
             block_params = []
             for i in param_def.keywords:
                 block_params.append(i)
-                used_kws[i] = 0
+                used_kws.add(i)
 
             for i in param_def.entites:
                 if i not in used_kws:
                     block_params.append(i)
-                    used_kws[i] = 0
+                    used_kws.add(i)
 
             extlist = behavior().external_list
 
             for param in block_params:
                 paramkw = param_def.getKeyword(param, None)
                 if paramkw is not None and not paramkw.isHidden():
-                    param_path = self.itemPath().absolutePath(param)
-                    typeid = get_cata_typeid(paramkw)
+                    param_path = item_path.absolutePath(param)
+                    typeid = param_path.keywordTypeId()
                     if param_path.isKeywordSequence() and \
                             not param_path.isInSequence() and \
                             param_path.keywordType() == \
@@ -1586,13 +1837,11 @@ class ParameterBlockItem(ParameterItem):
         """
         Item append to the parameter grid layout state.
         """
-        added = False
-        item_list = self._allBlocChildItems(self)
-        for pitem in item_list:
-            added = pitem.isAppended()
-            if added:
-                break
-        return added
+        # stop at the first appended item without flattening the subtree
+        for pitem in self._iterBlocChildItems(self):
+            if pitem.isAppended():
+                return True
+        return False
 
     def removeFrom(self):
         """Remove item from the parameter grid layout."""
@@ -1616,6 +1865,12 @@ class ParameterBlockItem(ParameterItem):
         glob = kwargs['glob'] if 'glob' in kwargs else False
         childvalue = self.storage
         if len(self.childItems()) > 0 and self.isItemList():
+            # list value is a tuple: it is kept until the item or one
+            # of its children is changed (values of slave items are
+            # not tracked)
+            key = ("list", kwargs.get('default', False))
+            if not glob and key in self._context_cache:
+                return self._context_cache[key]
             childvalue = tuple([item.slaveItem().itemValue(**kwargs) \
                                     if glob and item.slaveItem() is not None \
                                     else item.itemValue(**kwargs)
@@ -1625,6 +1880,8 @@ class ParameterBlockItem(ParameterItem):
                 if isinstance(childvalue[0].evaluation, (list, tuple)):
                     childvalue = childvalue[0]
             self.storage = childvalue
+            if not glob:
+                self._context_cache[key] = childvalue
         else:
             childvalue = super(ParameterBlockItem, self).itemValue(**kwargs)
         return childvalue
@@ -1633,6 +1890,24 @@ class ParameterBlockItem(ParameterItem):
         """
         Set values of child items.
 
+        Value changes are propagated to dependant and parent items
+        only once all values are set (see `flushValueChanges()`).
+
+        Arguments:
+            values: Dictionary with item values (see `childValues()`).
+        """
+        root = self.rootItem()
+        root._value_batch += 1
+        try:
+            self._setItemValue(values)
+        finally:
+            root._value_batch -= 1
+        root.flushValueChanges()
+
+    def _setItemValue(self, values):
+        """
+        Set values of child items (see `setItemValue()`).
+
         Arguments:
             values: Dictionary with item values (see `childValues()`).
         """
@@ -1644,17 +1919,23 @@ class ParameterBlockItem(ParameterItem):
                 val_list.append(values)
             list_len = len(val_list)
             child_len = len(self.childItems())
-            if list_len > child_len:
+            # items are added / removed all at once: repaint at the end
+            tbl = self.grid()
+            wid = tbl.parentWidget() if tbl is not None else None
+            if wid is not None:
+                wid.setUpdatesEnabled(False)
+            try:
                 for i in xrange(list_len - child_len):
                     apath = self.itemPath().absolutePath(str(child_len + i))
                     nitem = ParameterListItem(item_path=apath,
                                               parent_item=self)
                     nitem.appendTo()
-            if list_len < child_len:
-                for i in xrange(child_len - list_len):
-                    citem = self.childItems()[list_len]
+                for citem in self.childItems()[list_len:]:
                     citem.removeFrom()
                     self.removeChildItem(citem)
+            finally:
+                if wid is not None:
+                    wid.setUpdatesEnabled(True)
             for i in xrange(list_len):
                 item = self.childItems()[i]
                 item.setItemValue(val_list[i])
@@ -1734,8 +2015,10 @@ class ParameterBlockItem(ParameterItem):
         Invoked when item flags was changed
         """
         super(ParameterBlockItem, self).flagsChanged(flags)
+        # changed flags may be both set and reset: copy them bit by bit
+        state = self.flags() & flags
         for pitem in self.childItems():
-            pitem.modifyFlags(flags, self.testFlags(flags))
+            pitem.setFlags((pitem.flags() & ~flags) | state)
 
     def _createRules(self):
         """
@@ -1745,23 +2028,26 @@ class ParameterBlockItem(ParameterItem):
         if not self.isItemList():
             kword = self.itemPath().keyword()
             if kword is not None:
-                rulelist = kword.rules
-                for rule in rulelist:
-                    self._rules.append(ParameterRuleItem(self, rule))
+                self._rules = [ParameterRuleItem(self, rule)
+                               for rule in kword.rules]
 
     def _allBlocChildItems(self, item):
         """
         Get the all bloc child items recursivelly
         """
-        reslist = []
+        return list(self._iterBlocChildItems(item))
+
+    def _iterBlocChildItems(self, item):
+        """
+        Iterate over the all bloc child items recursivelly
+        """
         if item is not None:
-            itemlist = item.childItems()
-            for i in itemlist:
+            for i in item.childItems():
                 if i.cataTypeId() == IDS.bloc:
-                    reslist = reslist + self._allBlocChildItems(i)
+                    for j in self._iterBlocChildItems(i):
+                        yield j
                 else:
-                    reslist.append(i)
-        return reslist
+                    yield i
 
 
 class ParameterSequenceItem(ParameterEditItem):
@@ -1776,8 +2062,8 @@ class ParameterSequenceItem(ParameterEditItem):
         """
         super(ParameterSequenceItem, self).__init__(**kwargs)
 
-        if self.panel() is not None:
-            self.panel().gotoParameter.connect(self.parameterActivated)
+        if self.frame() is not None:
+            self.editor.gotoParameter.connect(self.parameterActivated)
 
     def panel(self):
         """
@@ -1791,6 +2077,18 @@ class ParameterSequenceItem(ParameterEditItem):
                     hasattr(self.editor, 'sequencePanel')) \
                     else None
 
+    def frame(self):
+        """
+        Gets the widget holding sequence panel
+
+        Returns:
+            (QWidget): Sequence panel container.
+        """
+        return self.editor.sequenceFrame() \
+            if (self.editor is not None and \
+                    hasattr(self.editor, 'sequenceFrame')) \
+                    else None
+
     def appendTo(self):
         """
         Append item to the parameter grid layout.
@@ -1802,8 +2100,8 @@ class ParameterSequenceItem(ParameterEditItem):
 
         tbl = self.grid()
         index = tbl.actualRowCount()
-        if self.panel() is not None:
-            tbl.addWidget(self.panel(), index, self.ColumnId.Label,
+        if self.frame() is not None:
+            tbl.addWidget(self.frame(), index, self.ColumnId.Label,
                           1, self.ColumnId.Editor - self.ColumnId.Label + 1)
 
         self.updateItem()
@@ -1818,8 +2116,8 @@ class ParameterSequenceItem(ParameterEditItem):
         super(ParameterSequenceItem, self).removeFrom()
 
         tbl = self.grid()
-        if self.panel() is not None:
-            tbl.removeWidget(self.panel())
+        if self.frame() is not None:
+            tbl.removeWidget(self.frame())
 
     def findItemByName(self, name):
         """
@@ -1834,6 +2132,23 @@ class ParameterSequenceItem(ParameterEditItem):
         return self.panel().findItemByName(name) \
             if self.panel() is not None else None
 
+    def cleanup(self):
+        """
+        Remove internal structures
+        """
+        if self.panel() is not None:
+            self.panel().releaseEditors()
+        super(ParameterSequenceItem, self).cleanup()
+
+    def releaseEditors(self):
+        """
+        Give editors of the item and of its sequence panel back
+        to the factory.
+        """
+        if self.panel() is not None:
+            self.panel().releaseEditors()
+        super(ParameterSequenceItem, self).releaseEditors()
+
     def updateTranslations(self):
         """
         Update translations in GUI elements.
@@ -1899,11 +2214,24 @@ class ParameterRuleItem(ParameterItem):
                      parent_item=None)
         self._parent_item = param_item
         self._rule = rule_obj
+        self._kwset = frozenset(self.ruleKeywords() or ())
         self._frame = None
         self._begitem = None
         self._enditem = None
         self._viswatcher = None
 
+    def rootItem(self):
+        """
+        Get root item.
+
+        Rule item is not a child of its parameter item, so the root
+        is taken from the parameter item.
+
+        Returns:
+            ParameterItem: Root item.
+        """
+        return self.parentItem().rootItem()
+
     def rule(self):
         """
         Returns the rule object
@@ -1930,7 +2258,7 @@ class ParameterRuleItem(ParameterItem):
         items = []
         if self.parentItem():
             for kword in self.ruleKeywords():
-                items = items + self.parentItem().findItemsByName(kword)
+                items.extend(self.parentItem().findItemsByName(kword))
         return self._removeExcluded(items)
 
     def childItems(self, **kwargs):
@@ -1943,14 +2271,9 @@ class ParameterRuleItem(ParameterItem):
         """
         itemlist = []
         owner = self.parentItem()
-        kwlist = self.ruleKeywords()
-        if owner is not None and kwlist is not None:
-            kwdict = {}
-            for kword in kwlist:
-                kwdict[kword] = 0
-            for item in owner.childItems(rec=True):
-                if item.itemName() in kwdict:
-                    itemlist.append(item)
+        if owner is not None:
+            itemlist = [item for item in owner.childItems(rec=True)
+                        if item.itemName() in self._kwset]
         return self._removeExcluded(itemlist)
 
     def containsKeyword(self, kword):
@@ -1960,8 +2283,7 @@ class ParameterRuleItem(ParameterItem):
         Returns:
             bool: True if the keyword exist in rule or False otherwise
         """
-        kwlist = self.ruleKeywords()
-        return kword in kwlist if kwlist is not None else False
+        return kword in self._kwset
 
     def containsItem(self, item):
         """
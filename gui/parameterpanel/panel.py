@@ -33,7 +33,7 @@ from PyQt5.Qt import (QAction, QLabel, QLineEdit, QRegExp, QStackedWidget,
 from common import (CFG, auto_dupl_on, bold, connect, get_cmd_mesh,
                     href, image, italic,
                     load_icon, load_pixmap, preformat, translate)
-from datamodel import CATA, IDS, get_cata_typeid
+from datamodel import CATA, IDS
 from datamodel.general import ConversionLevel
 from datamodel.command.helper import avail_meshes_in_cmd
 
@@ -48,6 +48,7 @@ from gui.commentpanel import CommentPanel
 from .windows import (ParameterTableWindow, ParameterListWindow,
                       ParameterMeshGroupWindow, ParameterFactWindow)
 from .widgets import ParameterTitle
+from .editors import ParameterEditor
 from .path import ParameterPath
 from .basic import EditorLink, Options
 
@@ -220,6 +221,7 @@ class ParameterPanel(EditionWidget, WidgetController):
             wid = self.views.widget(0)
             if wid is not None:
                 self.views.removeWidget(wid)
+                wid.view().releaseEditors()
                 wid.deleteLater()
 
     def store(self):
@@ -411,6 +413,7 @@ class ParameterPanel(EditionWidget, WidgetController):
         Update translations in GUI elements.
         """
         Options.use_translations = self.use_translations.isChecked()
+        Options.clear_translations()
         self._updateState()
         for i in xrange(self.views.count()):
             view = self.views.widget(i)
@@ -456,11 +459,11 @@ class ParameterPanel(EditionWidget, WidgetController):
                 ppath = ppath.absolutePath(name)
             if ppath.isInSequence():
                 txt_list.append("[" + name + "]")
-            elif get_cata_typeid(ppath.keyword()) in (IDS.simp, IDS.fact):
+            elif ppath.keywordTypeId() in (IDS.simp, IDS.fact):
                 # translate keyword
                 kwtext = Options.translate_command(ppath.command().title, name)
                 txt_list.append(kwtext)
-            elif get_cata_typeid(ppath.keyword()) == IDS.command:
+            elif ppath.keywordTypeId() == IDS.command:
                 # translate command
                 translation = Options.translate_command(name)
                 txt_list.append(translation)
@@ -504,6 +507,7 @@ class ParameterPanel(EditionWidget, WidgetController):
                 hide_unused = self.astergui().action(ActionType.HideUnused)
                 view.setUnusedVisibile(not hide_unused.isChecked())
             self.views.removeWidget(curview)
+            curview.view().releaseEditors()
             curview.deleteLater()
         self._updateState()
 
@@ -536,6 +540,7 @@ class ParameterPanel(EditionWidget, WidgetController):
         child_val = None
         wid = self._createParameterView(path, link)
         if act_item is not None:
+            ParameterEditor.flushPending()
             child_val = act_item.itemValue()
             act_item.setSlaveItem(wid.view())
         wid.view().setMasterItem(act_item)
@@ -27,6 +27,8 @@ panel for parameter identification.
 
 from __future__ import unicode_literals
 
+from datamodel import get_cata_typeid
+
 from .basic import CataInfo
 
 # note: the following pragma is added to prevent pylint complaining
@@ -37,6 +39,8 @@ from .basic import CataInfo
 class ParameterPath(object):
     """Class for parameter keyword path."""
 
+    __slots__ = ('_command', '_path', '_keyword', '_keywordtype', '_cache')
+
     separator = "."
 
     def __init__(self, cmd, **kwargs):
@@ -45,6 +49,7 @@ class ParameterPath(object):
 
         self._keyword = None
         self._keywordtype = None
+        self._cache = {}
 
         self._command = cmd
         apath = kwargs.get("path")
@@ -82,7 +87,9 @@ class ParameterPath(object):
         Returns:
               str: Object's name.
         """
-        return self.path().split(self.separator).pop()
+        if "name" not in self._cache:
+            self._cache["name"] = self.path().split(self.separator).pop()
+        return self._cache["name"]
 
     def names(self):
         """
@@ -233,6 +240,41 @@ class ParameterPath(object):
         """
         return self._keywordtype
 
+    def keywordTypeId(self):
+        """
+        Get the catalog type identifier of stored keyword.
+
+        Returns:
+            int: Keyword type identifier (see `IDS`).
+        """
+        if "typeid" not in self._cache:
+            self._cache["typeid"] = get_cata_typeid(self.keyword())
+        return self._cache["typeid"]
+
+    def keywordDefinition(self):
+        """
+        Get the definition of stored keyword.
+
+        Returns:
+            dict: Catalog keyword definition; *None* if there is no
+            keyword.
+        """
+        param_def = self.keyword()
+        return param_def.definition if param_def is not None else None
+
+    def isKeywordMandatory(self):
+        """
+        Check if stored keyword is mandatory.
+
+        Returns:
+            bool: *True* if the keyword is mandatory; *False* otherwise.
+        """
+        if "mandatory" not in self._cache:
+            param_def = self.keyword()
+            self._cache["mandatory"] = param_def is not None and \
+                param_def.isMandatory()
+        return self._cache["mandatory"]
+
     def isKeywordSequence(self):
         """
         Check if stored keyword is a sequence.
@@ -241,6 +283,9 @@ class ParameterPath(object):
             bool: *True* if the keyword is a sequence; *False*
             otherwise.
         """
+        if "sequence" in self._cache:
+            return self._cache["sequence"]
+
         is_list = False
         param_def = self.keyword()
         if param_def is not None and hasattr(param_def, "definition"):
@@ -252,6 +297,7 @@ class ParameterPath(object):
             if max_limit is not None or min_limit is not None:
                 degenerate = max_limit == 1
                 is_list = not degenerate
+        self._cache["sequence"] = is_list
         return is_list
 
     def isInSequence(self):
@@ -262,6 +308,9 @@ class ParameterPath(object):
             bool: *True* if the path stores item of a sequence; *False*
             otherwise.
         """
+        if "insequence" in self._cache:
+            return self._cache["insequence"]
+
         inseq = False
         parent_path = self.parentPath()
         if parent_path is not None:
@@ -270,6 +319,7 @@ class ParameterPath(object):
                 parent_kw = parent_kw.definition
             if self.name() not in parent_kw:
                 inseq = True
+        self._cache["insequence"] = inseq
         return inseq
 
     def _initialize_keyword(self):
@@ -277,6 +327,7 @@ class ParameterPath(object):
         Define internal keyword parameters.
         """
         self._keyword = None
+        self._cache = {}
         names = self.names()
         if self._command is not None:
             kwords = self._command.cata
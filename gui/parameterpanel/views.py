@@ -47,6 +47,7 @@ from gui.behavior import behavior
 from gui.widgets import FilterWidget, MessageBox
 
 from .basic import CataInfo, Options, parameterPanel
+from .editors import ParameterEditor
 from .items import ParameterBlockItem, ParameterListItem
 from .widgets import ParameterItemHilighter
 from .path import ParameterPath
@@ -100,6 +101,11 @@ class ParameterView(FilterWidget, ParameterBlockItem):
         uid (int): Parameter's UID.
     """
 
+    contentChanged = pyqtSignal()
+    """
+    Signal: emitted when value of view's items is changed.
+    """
+
     class GridLayout(QGridLayout):
         """
         Extended grid layout.
@@ -186,6 +192,30 @@ class ParameterView(FilterWidget, ParameterBlockItem):
             self._updateGrid()
         return self.layout()
 
+    def appendTo(self):
+        """
+        Append child items to the grid layout.
+
+        Repainting is suspended until all widgets are added.
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            super(ParameterView, self).appendTo()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _onUpdateTimeout(self):
+        """
+        Update items which state was changed.
+
+        Repainting is suspended until all items are updated.
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            super(ParameterView, self)._onUpdateTimeout()
+        finally:
+            self.setUpdatesEnabled(True)
+
     def panel(self):
         """
         Gets the panel which view belongs to.
@@ -234,6 +264,20 @@ class ParameterView(FilterWidget, ParameterBlockItem):
         """
         self.filterItem(text)
 
+    def itemValue(self, **kwargs):
+        """
+        Get values of child items.
+
+        Delayed value change notifications of editors are emitted
+        before values are collected.
+
+        Returns:
+            dict: Dictionary with all child item values.
+        """
+        ParameterEditor.flushPending()
+        self.flushValueChanges()
+        return super(ParameterView, self).itemValue(**kwargs)
+
     def setItemValue(self, values):
         """
         Set values of child items.
@@ -372,6 +416,7 @@ class ParameterView(FilterWidget, ParameterBlockItem):
 
         self.updateTranslations()
         self.itemStateChanged(self)
+        self.contentChanged.emit()
 
     def deleteItem(self, item):
         """
@@ -385,8 +430,7 @@ class ParameterView(FilterWidget, ParameterBlockItem):
         item.cleanup()
 
         items = self.childItems()
-        for idx in xrange(len(items)):
-            curitem = items[idx]
+        for idx, curitem in enumerate(items):
             curitem.itemPath().rename(str(idx))
             curitem.updateTranslations()
 
@@ -395,6 +439,7 @@ class ParameterView(FilterWidget, ParameterBlockItem):
 
         self.updateTranslations()
         self.itemStateChanged(self)
+        self.contentChanged.emit()
 
     def moveItem(self, item, step):
         """
@@ -407,11 +452,11 @@ class ParameterView(FilterWidget, ParameterBlockItem):
         self.removeFrom()
         self.moveChildItem(item, step)
         items = self.childItems()
-        for idx in xrange(len(items)):
-            curitem = items[idx]
+        for idx, curitem in enumerate(items):
             curitem.itemPath().rename(str(idx))
             curitem.updateTranslations()
         self.appendTo()
+        self.contentChanged.emit()
 
 
     def appendFrame(self, frame):
@@ -438,6 +483,13 @@ class ParameterView(FilterWidget, ParameterBlockItem):
             self._updateGrid()
             self.update()
 
+    def valueChanged(self):
+        """
+        Called when item's value is changed.
+        """
+        super(ParameterView, self).valueChanged()
+        self.contentChanged.emit()
+
     def parameterActivated(self, path, link=''):
         """
         Called when item's sub-editor is activated.
@@ -409,6 +409,18 @@ class ParameterButton(ElidedButton, ContentData):
         self._path = path
         self._text = text
 
+    def setPath(self, path):
+        """
+        Set keyword's path.
+
+        Contents are updated even if contents value is not changed.
+
+        Arguments:
+            path (ParameterPath): Keyword's path.
+        """
+        self._path = path
+        self._updateContents()
+
     def _updateContents(self):
         """
         Updates the contents string.